@@ -13,7 +13,6 @@ import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
-import json
 from datetime import datetime
 
 # Load environment
@@ -21,6 +20,7 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
 
 from anthropic import Anthropic
+from scripts.storage.queue_store import QueueStore
 
 # Initialize Claude
 anthropic_key = os.getenv('ANTHROPIC_API_KEY')
@@ -30,20 +30,12 @@ if not anthropic_key:
 
 claude_client = Anthropic(api_key=anthropic_key)
 
-# Queue file
+# Legacy queue file, imported into jobs.db the first time the queue is opened
 QUEUE_FILE = Path(__file__).parent / 'job_queue.json'
 
 def load_queue():
-    """Load job queue from file"""
-    if QUEUE_FILE.exists():
-        with open(QUEUE_FILE, 'r') as f:
-            return json.load(f)
-    return []
-
-def save_queue(queue):
-    """Save job queue to file"""
-    with open(QUEUE_FILE, 'w') as f:
-        json.dump(queue, f, indent=2)
+    """Open the job queue in jobs.db"""
+    return QueueStore('job_queue', legacy_file=QUEUE_FILE)
 
 def add_to_queue():
     """Add jobs to queue (quick mode for during work)"""
@@ -95,14 +87,22 @@ def add_to_queue():
             'status': 'queued'
         }
 
-        queue.append(job)
-        save_queue(queue)
+        if queue.has_url(url):
+            print("\n⚠️  This URL was queued before (maybe by a search)")
+            again = input("   Add it anyway? (yes/no): ").strip().lower()
+            if again not in ['yes', 'y']:
+                continue
+
+        queue.add(job)
         added += 1
 
         print(f"\n✅ Added to queue! ({len(queue)} total)")
         print("\nAdd another? (Enter job title, or type 'done' to finish)")
 
-    print(f"\n✅ Queue saved! {len(queue)} jobs ready to process.")
+    total = len(queue)
+    queue.close()
+
+    print(f"\n✅ Queue saved! {total} jobs ready to process.")
     print(f"\nRun 'python3 job_queue_mode.py process' to generate proposals for all.")
 
 def process_queue():
@@ -115,12 +115,13 @@ def process_queue():
         return
 
     # Filter to only queued jobs
-    pending = [j for j in queue if j.get('status') == 'queued']
+    pending = queue.items(status='queued')
 
     if not pending:
         print("\n✅ All jobs processed!")
-        print(f"   {len([j for j in queue if j.get('status') == 'completed'])} completed")
-        print(f"   {len([j for j in queue if j.get('status') == 'skipped'])} skipped")
+        print(f"   {queue.count(status='completed')} completed")
+        print(f"   {queue.count(status='skipped')} skipped")
+        queue.close()
         return
 
     print("="*80)
@@ -129,7 +130,7 @@ def process_queue():
     print("\nI'll analyze each job and generate proposals.")
     print("You review and decide: apply, skip, or edit.\n")
 
-    for i, job in enumerate(pending, 1):
+    for i, (key, job) in enumerate(pending, 1):
         print("\n" + "="*80)
         print(f"📋 JOB {i} of {len(pending)}")
         print("="*80)
@@ -163,8 +164,7 @@ def process_queue():
                 print(f"\n   💡 Low match score - suggest skipping")
                 skip = input("\n   Skip this job? (yes/no): ").strip().lower()
                 if skip in ['yes', 'y']:
-                    job['status'] = 'skipped'
-                    save_queue(queue)
+                    queue.update(key, status='skipped')
                     print("   ⏭️  Skipped!")
                     continue
 
@@ -199,10 +199,12 @@ def process_queue():
             action = input("\n   > ").strip().lower()
 
             if action == 'apply':
-                job['status'] = 'completed'
-                job['proposal'] = proposal
-                job['applied_at'] = datetime.now().isoformat()
-                save_queue(queue)
+                queue.update(
+                    key,
+                    status='completed',
+                    proposal=proposal,
+                    applied_at=datetime.now().isoformat()
+                )
                 print("\n   ✅ Marked as applied!")
 
                 if job['url'] != 'Not provided':
@@ -210,8 +212,7 @@ def process_queue():
                     print("   📋 Proposal is in your clipboard - just paste!")
 
             elif action == 'skip':
-                job['status'] = 'skipped'
-                save_queue(queue)
+                queue.update(key, status='skipped')
                 print("\n   ⏭️  Skipped!")
 
             elif action == 'edit':
@@ -229,9 +230,11 @@ def process_queue():
             print("   Leaving in queue")
 
     # Show summary
-    completed = len([j for j in queue if j.get('status') == 'completed'])
-    skipped = len([j for j in queue if j.get('status') == 'skipped'])
-    remaining = len([j for j in queue if j.get('status') == 'queued'])
+    counts = queue.status_counts()
+    completed = counts.get('completed', 0)
+    skipped = counts.get('skipped', 0)
+    remaining = counts.get('queued', 0)
+    queue.close()
 
     print("\n" + "="*80)
     print("📊 SUMMARY")
@@ -249,9 +252,10 @@ def view_queue():
         print("\n📭 Queue is empty!")
         return
 
-    queued = [j for j in queue if j.get('status') == 'queued']
-    completed = [j for j in queue if j.get('status') == 'completed']
-    skipped = [j for j in queue if j.get('status') == 'skipped']
+    queued = queue.jobs(status='queued')
+    counts = queue.status_counts()
+    recent_completed = queue.jobs(status='completed', limit=5)
+    queue.close()
 
     print("\n" + "="*80)
     print("📋 JOB QUEUE STATUS")
@@ -264,28 +268,30 @@ def view_queue():
             print(f"      Budget: {job['budget']}")
             print(f"      Added: {job['added_at'][:10]}")
 
+    completed = counts.get('completed', 0)
     if completed:
-        print(f"\n✅ APPLIED ({len(completed)} jobs):")
-        for job in completed[:5]:  # Show last 5
-            print(f"   • {job['title']} - {job.get('applied_at', '')[:10]}")
-        if len(completed) > 5:
-            print(f"   ... and {len(completed) - 5} more")
+        print(f"\n✅ APPLIED ({completed} jobs):")
+        for job in recent_completed:  # Show first 5
+            print(f"   • {job['title']} - {(job.get('applied_at') or '')[:10]}")
+        if completed > 5:
+            print(f"   ... and {completed - 5} more")
 
+    skipped = counts.get('skipped', 0)
     if skipped:
-        print(f"\n⏭️  SKIPPED ({len(skipped)} jobs)")
+        print(f"\n⏭️  SKIPPED ({skipped} jobs)")
 
     print("\n" + "="*80)
 
 def clear_completed():
     """Clear completed/skipped jobs from queue"""
     queue = load_queue()
-    new_queue = [j for j in queue if j.get('status') == 'queued']
 
-    removed = len(queue) - len(new_queue)
-    save_queue(new_queue)
+    removed = queue.clear(keep_status='queued')
+    remaining = len(queue)
+    queue.close()
 
     print(f"\n✅ Removed {removed} completed/skipped jobs")
-    print(f"   {len(new_queue)} jobs remaining in queue")
+    print(f"   {remaining} jobs remaining in queue")
 
 def analyze_job(job_title, job_budget, job_description):
     """Analyze job with Claude"""
@@ -5,7 +5,6 @@ Searches all configured job boards: Upwork, LinkedIn, Indeed, Dice, Remote board
 
 import os
 import sys
-import json
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
@@ -26,12 +25,15 @@ from scripts.automation.ziprecruiter_bot import ZipRecruiterBot
 # Import Indeed adapter
 from scripts.search.platform_adapters import IndeedAdapter
 
+from scripts.storage.queue_store import QueueStore
+
 
 class MultiPlatformJobSearch:
     """Unified job search across multiple platforms"""
 
     def __init__(self):
         """Initialize multi-platform search"""
+        # Legacy queue file, imported into jobs.db on first use
         self.queue_file = Path('multi_platform_queue.json')
         self.platforms_config = {
             'upwork': {
@@ -169,48 +171,47 @@ class MultiPlatformJobSearch:
 
     def save_to_queue(self, jobs_by_platform):
         """
-        Save jobs to unified queue file
+        Save jobs to the unified queue
 
         Args:
             jobs_by_platform: Dictionary with jobs organized by platform
         """
-        # Load existing queue
-        if self.queue_file.exists():
-            with open(self.queue_file, 'r') as f:
-                queue = json.load(f)
-        else:
-            queue = []
+        queue = self._open_queue()
 
-        # Add new jobs
-        added_count = 0
+        # Build queue items
+        queue_items = []
         for platform, jobs in jobs_by_platform.items():
             for job in jobs:
-                # Check if job already exists (by URL)
-                if not any(q['url'] == job.get('url') for q in queue):
-                    queue_item = {
-                        'platform': platform,
-                        'title': job.get('title', 'N/A'),
-                        'company': job.get('company', 'N/A'),
-                        'location': job.get('location', 'N/A'),
-                        'description': job.get('description', '')[:500],
-                        'url': job.get('url', ''),
-                        'added_at': datetime.now().isoformat(),
-                        'status': 'queued',  # queued, reviewed, applied, skipped
-                        'match_score': None,
-                        'analysis': None,
-                        'cover_letter': None,
-                        'applied_at': None
-                    }
-                    queue.append(queue_item)
-                    added_count += 1
-
-        # Save queue
-        with open(self.queue_file, 'w') as f:
-            json.dump(queue, f, indent=2)
+                queue_item = {
+                    'platform': platform,
+                    'title': job.get('title', 'N/A'),
+                    'company': job.get('company', 'N/A'),
+                    'location': job.get('location', 'N/A'),
+                    'description': job.get('description', '')[:500],
+                    'url': job.get('url', ''),
+                    'added_at': datetime.now().isoformat(),
+                    'status': 'queued',  # queued, reviewed, applied, skipped
+                    'match_score': None,
+                    'analysis': None,
+                    'cover_letter': None,
+                    'applied_at': None
+                }
+
+                queue_items.append(queue_item)
+
+        # Add in one transaction, skipping jobs already queued (by canonical URL)
+        keys = queue.add_many(queue_items)
+        added_count = len(keys) - keys.count(None)
+
+        stats = queue.dedup_stats()
+        total = len(queue)
+        queue.close()
 
         print(f"\nAdded {added_count} new jobs to queue")
-        print(f"Total jobs in queue: {len(queue)}")
-        print(f"Queue file: {self.queue_file.absolute()}")
+        print(f"Skipped {stats['duplicates']} duplicates "
+              f"({stats['duplicate_rate']:.0%} of {stats['checked']} found)")
+        print(f"Total jobs in queue: {total}")
+        print(f"Queue database: {queue.db.db_path}")
 
     def view_queue(self, status_filter=None):
         """
@@ -219,47 +220,37 @@ class MultiPlatformJobSearch:
         Args:
             status_filter: Filter by status (queued, reviewed, applied, skipped)
         """
-        if not self.queue_file.exists():
-            print("❌ No queue file found. Run search first.")
-            return
-
-        with open(self.queue_file, 'r') as f:
-            queue = json.load(f)
+        with self._open_queue() as queue:
+            if not queue:
+                print("❌ Queue is empty. Run search first.")
+                return
 
-        if status_filter:
-            queue = [j for j in queue if j['status'] == status_filter]
+            total = queue.count(status=status_filter)
+            by_status = queue.status_counts()
+            if status_filter:
+                by_status = {status_filter: by_status.get(status_filter, 0)}
+            by_platform = queue.platform_counts(status=status_filter)
+            sample = queue.jobs(status=status_filter, limit=10)
 
         print("\n" + "="*80)
-        print(f"JOB QUEUE ({len(queue)} jobs)")
+        print(f"JOB QUEUE ({total} jobs)")
         if status_filter:
             print(f"Filter: {status_filter}")
         print("="*80)
 
-        # Group by status
-        by_status = {}
-        for job in queue:
-            status = job['status']
-            by_status[status] = by_status.get(status, 0) + 1
-
         print("\nStatus breakdown:")
         for status, count in sorted(by_status.items()):
             print(f"  {status.ljust(10)} : {count}")
 
-        # Group by platform
-        by_platform = {}
-        for job in queue:
-            platform = job['platform']
-            by_platform[platform] = by_platform.get(platform, 0) + 1
-
         print("\nPlatform breakdown:")
-        for platform, count in sorted(by_platform.items()):
-            print(f"  {platform.ljust(15)} : {count}")
+        for platform, count in sorted(by_platform.items(), key=lambda item: item[0] or ''):
+            print(f"  {(platform or 'unknown').ljust(15)} : {count}")
 
         # Show some jobs
         print("\n" + "-"*80)
         print("Sample jobs:")
         print("-"*80)
-        for idx, job in enumerate(queue[:10], 1):
+        for idx, job in enumerate(sample, 1):
             print(f"\n{idx}. [{job['status'].upper()}] {job['title']}")
             print(f"   Company: {job['company']}")
             print(f"   Platform: {job['platform']}")
@@ -270,31 +261,46 @@ class MultiPlatformJobSearch:
 
         print("\n" + "="*80)
 
-    def export_queue_csv(self, output_file='jobs_export.csv'):
-        """Export queue to CSV file"""
-        if not self.queue_file.exists():
-            print("❌ No queue file found.")
-            return
+    def export_queue_columnar(self, output_file='jobs_export.parquet', include_description=True):
+        """Export queue to a Parquet or Arrow IPC file (needs pyarrow)"""
+        from scripts.storage.columnar_export import export_queue
+
+        with self._open_queue() as queue:
+            count = export_queue(
+                queue,
+                output_file,
+                include_description=include_description
+            )
+        print(f"✅ Exported {count} jobs to {output_file}")
+
+    def export_queue_csv(self, output_file='jobs_export.csv', since=False):
+        """Export queue to a CSV or JSONL file, optionally .gz/.zst compressed
 
-        import csv
+        Args:
+            output_file: Destination file
+            since: Append only jobs queued since the last export to this file
+        """
+        from scripts.storage.stream_export import export_queue
 
-        with open(self.queue_file, 'r') as f:
-            queue = json.load(f)
+        fieldnames = ['platform', 'title', 'company', 'location', 'status', 'match_score', 'url', 'added_at']
 
-        # Write CSV
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        with self._open_queue() as queue:
             if not queue:
                 print("❌ Queue is empty.")
                 return
 
-            fieldnames = ['platform', 'title', 'company', 'location', 'status', 'match_score', 'url', 'added_at']
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+            try:
+                result = export_queue(queue, output_file, fieldnames, since=since)
+            except ValueError as e:
+                print(f"❌ {e}")
+                return
 
-            writer.writeheader()
-            for job in queue:
-                writer.writerow(job)
+        verb = 'Appended' if result['appended'] else 'Exported'
+        print(f"✅ {verb} {result['rows']} jobs to {output_file}")
 
-        print(f"✅ Exported {len(queue)} jobs to {output_file}")
+    def _open_queue(self):
+        """Open the multi-platform queue, importing the legacy file once"""
+        return QueueStore('multi_platform_queue', legacy_file=str(self.queue_file))
 
 
 def main():
@@ -311,6 +317,8 @@ def main():
         print("  python multi_platform_search.py search [keyword] [location] [limit]")
         print("  python multi_platform_search.py view [status]")
         print("  python multi_platform_search.py export [filename]")
+        print("  python multi_platform_search.py export jobs.parquet [--no-description]")
+        print("  python multi_platform_search.py export jobs.jsonl.gz [--since]")
         print("\nExamples:")
         print("  python multi_platform_search.py search \"automation developer\" \"Remote\" 10")
         print("  python multi_platform_search.py view queued")
@@ -343,7 +351,10 @@ def main():
 
     elif command == 'export':
         output_file = sys.argv[2] if len(sys.argv) > 2 else 'jobs_export.csv'
-        searcher.export_queue_csv(output_file)
+        if output_file.endswith(('.parquet', '.arrow')):
+            searcher.export_queue_columnar(output_file, '--no-description' not in sys.argv)
+        else:
+            searcher.export_queue_csv(output_file, '--since' in sys.argv)
 
     else:
         print(f"❌ Unknown command: {command}")
@@ -13,6 +13,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from storage.profile_manager import ProfileManager
 from storage.job_database import JobDatabase
+from storage.columnar_export import export_jobs
+from storage.ingestion_service import IngestionClient
 from search.job_discoverer import JobDiscoverer
 from search.platform_adapters import LinkedInAdapter, IndeedAdapter, GlassdoorAdapter
 from analysis.job_scorer import JobScorer
@@ -27,7 +29,8 @@ class JobFinder:
     def __init__(self):
         """Initialize JobFinder with all components"""
         self.profile_manager = ProfileManager()
-        self.job_database = JobDatabase()
+        self.job_database = JobDatabase(compact=True)
+        self.ingestion = IngestionClient(self.job_database)
         self.job_discoverer = JobDiscoverer()
         self.job_scorer = JobScorer()
         self.comparison_engine = ComparisonEngine()
@@ -75,9 +78,9 @@ class JobFinder:
         # Score jobs based on profile match
         scored_jobs = self.job_scorer.score_batch(jobs, profile)
 
-        # Save to database
-        for job in scored_jobs:
-            self.job_database.save_job(job)
+        # Hand off to the ingestion service if it is running, otherwise
+        # save directly in one transaction
+        self.ingestion.submit(scored_jobs)
 
         return scored_jobs
 
@@ -99,12 +102,16 @@ class JobFinder:
             job_ids: List of job IDs to compare
 
         Returns:
-            Comparison analysis
+            Comparison analysis, with 'missing_job_ids' if any were not found
         """
-        jobs = [self.job_database.get_job(job_id) for job_id in job_ids]
+        jobs, missing = self.job_database.get_jobs(job_ids)
         profile = self.profile_manager.get_active_profile()
 
-        return self.comparison_engine.compare(jobs, profile)
+        comparison = self.comparison_engine.compare(jobs, profile)
+        if missing:
+            comparison['missing_job_ids'] = missing
+
+        return comparison
 
     def apply_to_job(self, job_id: str, custom_message: Optional[str] = None) -> Dict:
         """Apply to a specific job
@@ -146,6 +153,29 @@ class JobFinder:
         """
         return self.job_database.get_application_stats()
 
+    def export_jobs(
+        self,
+        output_path: str,
+        include_description: bool = True,
+        filters: Optional[Dict] = None
+    ) -> int:
+        """Export the jobs database to Parquet or Arrow IPC
+
+        Args:
+            output_path: Destination file (.parquet or .arrow)
+            include_description: Keep the description/requirements text
+            filters: Optional search filters
+
+        Returns:
+            Number of jobs exported
+        """
+        return export_jobs(
+            self.job_database,
+            output_path,
+            include_description=include_description,
+            filters=filters
+        )
+
 
 def main():
     """Main entry point for JobFinder agent"""
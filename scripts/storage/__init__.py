@@ -2,5 +2,9 @@
 
 from .profile_manager import ProfileManager
 from .job_database import JobDatabase
+from .async_job_database import AsyncJobDatabase
+from .ingestion_service import IngestionClient, IngestionService
+from .queue_store import QueueStore
 
-__all__ = ['ProfileManager', 'JobDatabase']
+__all__ = ['ProfileManager', 'JobDatabase', 'AsyncJobDatabase',
+           'IngestionClient', 'IngestionService', 'QueueStore']
@@ -0,0 +1,263 @@
+"""
+Async Job Database - asyncio facade over JobDatabase
+"""
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .job_database import JobDatabase
+
+
+class AsyncJobDatabase:
+    """Non-blocking JobDatabase for asyncio callers
+
+    Writes are queued to a single writer thread that groups whatever has
+    arrived into one transaction, so many coroutines saving at once share
+    a commit. Reads run on a small thread pool, each thread with its own
+    pooled connection, so they never wait on the writer (WAL mode).
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        readers: int = 4,
+        max_group: int = 200,
+        group_wait: float = 0.005,
+        **db_options
+    ):
+        """Initialize AsyncJobDatabase
+
+        Args:
+            db_path: Path to SQLite database file
+            readers: Number of reader threads
+            max_group: Maximum writes committed in one transaction
+            group_wait: Seconds the writer waits for more writes to group
+            **db_options: Extra JobDatabase arguments (timeout, cache_size)
+        """
+        self.db = JobDatabase(db_path, **db_options)
+        self.max_group = max_group
+        self.group_wait = group_wait
+
+        self._readers = ThreadPoolExecutor(
+            max_workers=readers,
+            thread_name_prefix='jobdb-reader'
+        )
+        self._writes: 'queue.Queue[Optional[Tuple]]' = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_loop,
+            name='jobdb-writer',
+            daemon=True
+        )
+        self._writer.start()
+
+    async def __aenter__(self) -> 'AsyncJobDatabase':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def save_job(self, job: Dict) -> str:
+        """Save or update a job listing
+
+        Args:
+            job: Job data dictionary
+
+        Returns:
+            Job ID
+        """
+        return (await self.save_jobs([job]))[0]
+
+    async def save_jobs(self, jobs: Iterable[Dict], chunk_size: int = 500) -> List[str]:
+        """Save or update many job listings
+
+        Args:
+            jobs: Iterable of job data dictionaries
+            chunk_size: Number of rows handed to each executemany call
+
+        Returns:
+            Job IDs in input order
+        """
+        return await self._write(self.db.save_jobs, list(jobs), chunk_size)
+
+    async def update_status(self, job_id: str, status: str) -> bool:
+        """Update job application status
+
+        Args:
+            job_id: Job identifier
+            status: New status (new/saved/applied/rejected/interview)
+
+        Returns:
+            True if updated, False if not found
+        """
+        return await self._write(self.db.update_status, job_id, status)
+
+    async def get_job(self, job_id: str, include_archive: bool = False) -> Optional[Dict]:
+        """Retrieve a job by ID
+
+        Args:
+            job_id: Job identifier
+            include_archive: Also look in the archive database on a miss
+
+        Returns:
+            Job data or None
+        """
+        return await self._read(self.db.get_job, job_id, include_archive)
+
+    async def get_jobs(self, job_ids: Iterable[str]) -> Tuple[List[Dict], List[str]]:
+        """Retrieve many jobs by ID
+
+        Args:
+            job_ids: Job identifiers
+
+        Returns:
+            Tuple of (jobs in input order, IDs that were not found)
+        """
+        return await self._read(self.db.get_jobs, list(job_ids))
+
+    async def search_jobs(self, filters: Dict) -> List[Dict]:
+        """Search jobs with filters
+
+        Args:
+            filters: Search filters (see JobDatabase.search_jobs)
+
+        Returns:
+            List of matching jobs
+        """
+        return await self._read(self.db.search_jobs, filters)
+
+    async def iter_jobs(
+        self,
+        filters: Optional[Dict] = None,
+        page_size: int = 500,
+        cursor: Optional[str] = None
+    ) -> AsyncIterator[Dict]:
+        """Stream jobs page by page with flat memory use
+
+        Args:
+            filters: Search filters (see JobDatabase.search_jobs)
+            page_size: Number of rows fetched per query
+            cursor: Optional token from get_jobs_page to resume from
+
+        Yields:
+            Job data dictionaries in match score order
+        """
+        while True:
+            jobs, cursor = await self._read(
+                self.db.get_jobs_page, filters, page_size, cursor
+            )
+            for job in jobs:
+                yield job
+
+            if cursor is None:
+                return
+
+    async def get_application_stats(self) -> Dict:
+        """Get application statistics
+
+        Returns:
+            Dictionary with statistics
+        """
+        return await self._read(self.db.get_application_stats)
+
+    async def close(self) -> None:
+        """Flush queued writes, stop the worker threads and close connections"""
+        if self._writer.is_alive():
+            self._writes.put(None)
+            await asyncio.get_running_loop().run_in_executor(None, self._writer.join)
+
+        self._readers.shutdown(wait=True)
+        self.db.close()
+
+    async def _read(self, method: Callable, *args):
+        """Run a read method on the reader pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, method, *args)
+
+    async def _write(self, method: Callable, *args):
+        """Queue a write for the writer thread and wait for its result"""
+        if not self._writer.is_alive():
+            raise RuntimeError('AsyncJobDatabase is closed')
+
+        future: Future = Future()
+        self._writes.put((method, args, future))
+        return await asyncio.wrap_future(future)
+
+    def _write_loop(self) -> None:
+        """Writer thread: commit queued writes in groups until closed"""
+        while True:
+            request = self._writes.get()
+            if request is None:
+                return
+
+            group = [request]
+            stop = False
+
+            while len(group) < self.max_group:
+                try:
+                    request = self._writes.get(timeout=self.group_wait)
+                except queue.Empty:
+                    break
+
+                if request is None:
+                    stop = True
+                    break
+                group.append(request)
+
+            self._commit_group(group)
+
+            if stop:
+                return
+
+    def _commit_group(self, group: List[Tuple]) -> None:
+        """Run a group of writes in one transaction
+
+        Writes whose caller was cancelled before the group started are
+        skipped. If the group fails, each write is retried on its own so one
+        bad request only fails its own caller.
+
+        Args:
+            group: (method, args, future) write requests
+        """
+        # Marks each future running, after which it can no longer be
+        # cancelled under the writer's feet
+        group = [request for request in group if request[2].set_running_or_notify_cancel()]
+        if not group:
+            return
+
+        try:
+            with self.db._transaction(immediate=True):
+                results = [method(*args) for method, args, _ in group]
+        except Exception as e:
+            if len(group) == 1:
+                _resolve(group[0][2], error=e)
+            else:
+                for request in group:
+                    self._run_single(request)
+            return
+
+        for (_, _, future), result in zip(group, results):
+            _resolve(future, result)
+
+    def _run_single(self, request: Tuple) -> None:
+        """Run one write in its own transaction and resolve its future"""
+        method, args, future = request
+        try:
+            result = method(*args)
+        except Exception as e:
+            _resolve(future, error=e)
+            return
+        _resolve(future, result)
+
+
+def _resolve(future: Future, result=None, error: Optional[Exception] = None) -> None:
+    """Deliver a write's outcome; a caller that has gone away is ignored"""
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
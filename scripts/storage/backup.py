@@ -0,0 +1,282 @@
+"""
+Backup - Online snapshots, restore and integrity checks for jobs.db
+
+Snapshots use SQLite's backup API a batch of pages at a time, sleeping
+between batches, so they can run while discovery is writing. The source
+is read inside one read transaction, which under WAL never blocks writers
+and keeps the copy consistent: concurrent commits do not restart it.
+
+Run it with:
+    python -m scripts.storage.backup snapshot [dest]
+    python -m scripts.storage.backup restore <snapshot>
+    python -m scripts.storage.backup check [path]
+"""
+
+import os
+import re
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from .job_database import JobDatabase
+
+
+BACKUP_DIR = Path.home() / '.jobfinder' / 'backups'
+
+
+def snapshot(
+    db: JobDatabase,
+    dest: Optional[str] = None,
+    pages: int = 256,
+    pause: float = 0.05,
+    keep: Optional[int] = None
+) -> Path:
+    """Copy the database to a snapshot file without stalling writers
+
+    The archive database, if there is one, is snapshotted alongside as
+    <dest stem>_archive<suffix>. Each copy is written to a temporary file
+    and only moved into place once it passes an integrity check.
+
+    Args:
+        db: Database to snapshot
+        dest: Snapshot path, a timestamped file in BACKUP_DIR if None
+        pages: Pages copied per backup step
+        pause: Seconds to sleep between steps
+        keep: Keep only this many most recent timestamped snapshots of
+            db in dest's directory
+
+    Returns:
+        Path of the snapshot
+
+    Raises:
+        RuntimeError: If a copy fails its integrity check
+    """
+    if dest is None:
+        BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        dest = BACKUP_DIR / f'{db.db_path.stem}-{stamp}{db.db_path.suffix}'
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+
+    _copy(db.db_path, dest, pages, pause)
+    if db.archive_path.exists():
+        _copy(db.archive_path, _archive_path(dest), pages, pause)
+
+    if keep is not None:
+        _prune_snapshots(db, dest, keep)
+
+    return dest
+
+
+def restore(db: JobDatabase, source: str) -> None:
+    """Replace the database contents with a snapshot
+
+    The snapshot is checked first and copied in through the backup API,
+    so open connections see the restored data instead of a swapped file.
+    Writers wait on the lock for the duration of the copy. If the snapshot
+    has no archive, the current archive is emptied to match it. The
+    schema is brought up to date afterwards, in case the snapshot is older.
+
+    Args:
+        db: Database to overwrite
+        source: Snapshot written by snapshot()
+
+    Raises:
+        FileNotFoundError: If the snapshot does not exist
+        RuntimeError: If the snapshot fails its integrity check
+    """
+    source = Path(source)
+    if not source.exists():
+        raise FileNotFoundError(f"Snapshot not found: {source}")
+
+    pairs = [(source, db.db_path)]
+    has_archive = _archive_path(source).exists()
+    if has_archive:
+        pairs.append((_archive_path(source), db.archive_path))
+
+    for snapshot_path, target in pairs:
+        problems = check_integrity(snapshot_path)
+        if problems:
+            raise RuntimeError(f"Snapshot {snapshot_path} is corrupt: {problems[0]}")
+
+    for snapshot_path, target in pairs:
+        src = sqlite3.connect(snapshot_path)
+        dst = sqlite3.connect(target, timeout=db.timeout)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+            src.close()
+
+    if not has_archive and db.archive_path.exists():
+        _empty_database(db.archive_path, db.timeout)
+
+    db.cache.clear()
+    db._init_database()
+
+
+def check_integrity(path: str, quick: bool = False) -> List[str]:
+    """Check a database file for corruption
+
+    The full check also verifies the full-text index against the jobs
+    table; it takes the write lock while doing so, so run it on snapshots
+    rather than the live database.
+
+    Args:
+        path: Database file
+        quick: Run PRAGMA quick_check only
+
+    Returns:
+        Problems found, empty if the database is sound
+    """
+    conn = sqlite3.connect(path)
+    try:
+        pragma = 'quick_check' if quick else 'integrity_check'
+        problems = [
+            row[0] for row in conn.execute(f'PRAGMA {pragma}')
+            if row[0] != 'ok'
+        ]
+
+        has_fts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'"
+        ).fetchone() is not None
+
+        if not quick and not problems and has_fts:
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT INTO jobs_fts(jobs_fts, rank) VALUES ('integrity-check', 1)"
+                    )
+            except sqlite3.DatabaseError as e:
+                problems.append(f'jobs_fts: {e}')
+
+        return problems
+    finally:
+        conn.close()
+
+
+def _copy(source: Path, dest: Path, pages: int, pause: float) -> None:
+    """Back up one database file into dest via a verified temporary file"""
+    partial = dest.with_name(dest.name + '.part')
+    if partial.exists():
+        partial.unlink()
+
+    src = sqlite3.connect(source)
+    dst = sqlite3.connect(partial)
+    try:
+        # Pin one read snapshot for the whole copy
+        src.execute('BEGIN')
+        src.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()
+
+        src.backup(
+            dst,
+            pages=pages,
+            progress=lambda status, remaining, total: time.sleep(pause)
+        )
+        src.rollback()
+
+        # A standalone file is easier to move and archive than a WAL pair
+        dst.execute('PRAGMA journal_mode=DELETE')
+    finally:
+        dst.close()
+        src.close()
+
+    problems = check_integrity(partial)
+    if problems:
+        partial.unlink()
+        raise RuntimeError(f"Snapshot of {source} failed its integrity check: {problems[0]}")
+
+    os.replace(partial, dest)
+
+
+def _empty_database(path: Path, timeout: float) -> None:
+    """Delete every row from a database file's tables
+
+    Emptied rather than deleted, since connections may have it attached.
+    """
+    conn = sqlite3.connect(path, timeout=timeout)
+    try:
+        with conn:
+            tables = [
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+                )
+            ]
+            for table in tables:
+                conn.execute(f'DELETE FROM "{table}"')
+    finally:
+        conn.close()
+
+
+def _archive_path(path: Path) -> Path:
+    """Archive database path that pairs with a database path"""
+    return path.with_name(f'{path.stem}_archive{path.suffix}')
+
+
+def _prune_snapshots(db: JobDatabase, dest: Path, keep: int) -> None:
+    """Delete all but the newest keep snapshots of db next to dest
+
+    Only files named exactly like snapshot()'s default
+    (<db stem>-YYYYmmdd-HHMMSS<suffix>) are considered, and never the live
+    database or its archive.
+    """
+    live = {db.db_path.resolve(), db.archive_path.resolve()}
+    pattern = re.compile(
+        re.escape(db.db_path.stem) + r'-\d{8}-\d{6}' + re.escape(db.db_path.suffix)
+    )
+    snapshots = sorted(
+        (
+            path for path in dest.parent.iterdir()
+            if pattern.fullmatch(path.name) and path.resolve() not in live
+        ),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True
+    )
+
+    for path in snapshots[keep:]:
+        path.unlink()
+        if _archive_path(path).exists() and _archive_path(path).resolve() not in live:
+            _archive_path(path).unlink()
+
+
+def main() -> None:
+    """Command-line entry point"""
+    if len(sys.argv) < 2 or sys.argv[1] not in ('snapshot', 'restore', 'check'):
+        print("Usage:")
+        print("  python -m scripts.storage.backup snapshot [dest]")
+        print("  python -m scripts.storage.backup restore <snapshot>")
+        print("  python -m scripts.storage.backup check [path]")
+        sys.exit(1)
+
+    command = sys.argv[1]
+    arg = sys.argv[2] if len(sys.argv) > 2 else None
+
+    if command == 'check':
+        path = arg or str(Path.home() / '.jobfinder' / 'jobs.db')
+        # Quick check only on the live database so writers are not blocked
+        problems = check_integrity(path, quick=arg is None)
+        if problems:
+            print(f"❌ {path} has {len(problems)} problem(s):")
+            for problem in problems:
+                print(f"  {problem}")
+            sys.exit(1)
+        print(f"✅ {path} passed the integrity check")
+        return
+
+    with JobDatabase() as db:
+        if command == 'snapshot':
+            path = snapshot(db, arg)
+            print(f"✅ Snapshot written to {path}")
+        else:
+            if arg is None:
+                print("❌ Give the snapshot to restore")
+                sys.exit(1)
+            restore(db, arg)
+            print(f"✅ Restored {db.db_path} from {arg}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Codec - Compact binary encoding for stored JSON payloads
+
+Payloads are JSON compressed with zstd when the optional zstandard
+package is installed and zlib otherwise. A one-byte prefix records the
+codec so either side can read what the other wrote.
+"""
+
+import json
+import zlib
+from typing import Any
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+ZLIB_PREFIX = b'z'
+ZSTD_PREFIX = b's'
+
+
+def compress_json(value: Any, level: int = 6) -> bytes:
+    """Serialize a value to compressed JSON bytes
+
+    Args:
+        value: JSON-serializable value
+        level: Compression level
+
+    Returns:
+        Codec prefix followed by the compressed JSON
+    """
+    raw = json.dumps(value, separators=(',', ':')).encode()
+
+    if zstandard is not None:
+        return ZSTD_PREFIX + zstandard.ZstdCompressor(level=level).compress(raw)
+
+    return ZLIB_PREFIX + zlib.compress(raw, level)
+
+
+def decompress_json(blob: bytes) -> Any:
+    """Decode bytes written by compress_json
+
+    Args:
+        blob: Codec prefix followed by compressed JSON
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable
+    """
+    prefix, payload = blob[:1], blob[1:]
+
+    if prefix == ZLIB_PREFIX:
+        return json.loads(zlib.decompress(payload))
+
+    if prefix == ZSTD_PREFIX:
+        if zstandard is None:
+            raise ValueError("Payload is zstd-compressed; install zstandard to read it")
+        return json.loads(zstandard.ZstdDecompressor().decompress(payload))
+
+    raise ValueError(f"Unknown payload codec: {prefix!r}")
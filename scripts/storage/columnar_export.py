@@ -0,0 +1,225 @@
+"""
+Columnar Export - Parquet / Arrow IPC exports of jobs and queues
+
+Requires pyarrow (pip install pyarrow). Rows are written in record-batch
+sized chunks so memory stays bounded regardless of corpus size, and
+salary, score and date fields keep real numeric/timestamp types.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# (column, arrow type name) for the jobs table export
+JOB_EXPORT_COLUMNS = (
+    ('id', 'string'),
+    ('platform', 'string'),
+    ('title', 'string'),
+    ('company', 'string'),
+    ('location', 'string'),
+    ('work_type', 'string'),
+    ('salary_min', 'int64'),
+    ('salary_max', 'int64'),
+    ('match_score', 'float64'),
+    ('status', 'string'),
+    ('url', 'string'),
+    ('posted_date', 'string'),
+    ('discovered_at', 'timestamp'),
+    ('last_seen_at', 'timestamp'),
+    ('applied_at', 'timestamp'),
+    ('description', 'string'),
+    ('requirements', 'string'),
+)
+
+# (field, arrow type name) for the job_queue / multi_platform_queue queues
+QUEUE_EXPORT_COLUMNS = (
+    ('platform', 'string'),
+    ('title', 'string'),
+    ('company', 'string'),
+    ('location', 'string'),
+    ('budget', 'string'),
+    ('match_score', 'float64'),
+    ('status', 'string'),
+    ('url', 'string'),
+    ('added_at', 'timestamp'),
+    ('applied_at', 'timestamp'),
+    ('description', 'string'),
+)
+
+# Large free-text columns dropped when include_description is False
+TEXT_COLUMNS = ('description', 'requirements')
+
+FORMATS = ('parquet', 'arrow')
+
+# Range of the int64 columns salaries are exported to
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def export_jobs(
+    db,
+    output_path: str,
+    fmt: Optional[str] = None,
+    include_description: bool = True,
+    filters: Optional[Dict] = None,
+    batch_size: int = 50000
+) -> int:
+    """Export the jobs table to Parquet or Arrow IPC
+
+    Args:
+        db: JobDatabase to export
+        output_path: Destination file
+        fmt: 'parquet' or 'arrow', inferred from the extension if None
+        include_description: Keep the description/requirements text
+        filters: Search filters (see JobDatabase.search_jobs)
+        batch_size: Rows per record batch / row group
+
+    Returns:
+        Number of rows written
+    """
+    columns = _select_columns(JOB_EXPORT_COLUMNS, include_description)
+    names = [name for name, _ in columns]
+    batches = db.iter_row_batches(names, filters, batch_size)
+
+    return _write(output_path, fmt, columns, batches)
+
+
+def export_queue(
+    queue,
+    output_path: str,
+    fmt: Optional[str] = None,
+    include_description: bool = True,
+    batch_size: int = 50000
+) -> int:
+    """Export a job queue to Parquet or Arrow IPC
+
+    Args:
+        queue: QueueStore to export
+        output_path: Destination file
+        fmt: 'parquet' or 'arrow', inferred from the extension if None
+        include_description: Keep the description text
+        batch_size: Rows per record batch / row group
+
+    Returns:
+        Number of rows written
+    """
+    columns = _select_columns(QUEUE_EXPORT_COLUMNS, include_description)
+    names = [name for name, _ in columns]
+    batches = queue.iter_row_batches(names, batch_size=batch_size)
+
+    return _write(output_path, fmt, columns, batches)
+
+
+def _select_columns(columns: Tuple, include_description: bool) -> List[Tuple[str, str]]:
+    """Drop the large text columns unless they were asked for"""
+    return [
+        (name, type_name) for name, type_name in columns
+        if include_description or name not in TEXT_COLUMNS
+    ]
+
+
+def _write(
+    output_path: str,
+    fmt: Optional[str],
+    columns: List[Tuple[str, str]],
+    batches: Iterable[List[Tuple]]
+) -> int:
+    """Write row batches to a columnar file, one record batch at a time
+
+    Args:
+        output_path: Destination file
+        fmt: 'parquet' or 'arrow', inferred from the extension if None
+        columns: (name, arrow type name) pairs matching the row tuples
+        batches: Iterable of row tuple lists
+
+    Returns:
+        Number of rows written
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError(
+            "Columnar export requires pyarrow. Install it with: pip install pyarrow"
+        )
+
+    fmt = fmt or ('arrow' if Path(output_path).suffix in ('.arrow', '.feather', '.ipc') else 'parquet')
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}' (expected one of {FORMATS})")
+
+    arrow_types = {
+        'string': pa.string(),
+        'int64': pa.int64(),
+        'float64': pa.float64(),
+        'timestamp': pa.timestamp('us'),
+    }
+    schema = pa.schema([(name, arrow_types[type_name]) for name, type_name in columns])
+    converters = [_CONVERTERS[type_name] for _, type_name in columns]
+
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(output_path, schema, compression='zstd')
+        write_batch = writer.write_batch
+    else:
+        writer = pa.ipc.new_file(output_path, schema)
+        write_batch = writer.write_batch
+
+    rows_written = 0
+    try:
+        for rows in batches:
+            arrays = [
+                pa.array([convert(row[i]) for row in rows], type=schema.field(i).type)
+                for i, convert in enumerate(converters)
+            ]
+            write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            rows_written += len(rows)
+    finally:
+        writer.close()
+
+    return rows_written
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """Coerce a salary-like value to int, None if not numeric or not int64"""
+    if value is None or value == '':
+        return None
+    try:
+        number = value if isinstance(value, int) else int(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return number if INT64_MIN <= number <= INT64_MAX else None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Coerce a score-like value to float, None if it is not numeric"""
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO timestamp, None if missing or malformed"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _to_string(value: Any) -> Optional[str]:
+    """Render a value as text, None stays None"""
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    'string': _to_string,
+    'int64': _to_int,
+    'float64': _to_float,
+    'timestamp': _to_timestamp,
+}
@@ -0,0 +1,414 @@
+"""
+Ingestion Service - Single writer process for jobs.db
+
+Several bots and CLIs writing jobs.db from separate processes contend for
+SQLite's write lock and fail with "database is locked". Running this
+service makes it the only writer: clients hand job batches over a local
+socket without waiting, and the service commits whatever has arrived in
+grouped transactions. When the service is not running, clients save
+directly to the database instead.
+
+Jobs the database refuses are not dropped with the rest of their group:
+the group is retried batch by batch, then job by job, and whatever still
+fails is appended to ~/.jobfinder/ingest_rejects.jsonl.
+
+Run it with:
+    python -m scripts.storage.ingestion_service [db_path]
+"""
+
+import json
+import os
+import queue
+import socket
+import sys
+import threading
+from datetime import datetime
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .job_database import JobDatabase
+
+
+Address = Union[str, Tuple[str, int]]
+
+JOBFINDER_DIR = Path.home() / '.jobfinder'
+AUTHKEY_FILE = JOBFINDER_DIR / 'ingest.key'
+REJECTS_FILE = JOBFINDER_DIR / 'ingest_rejects.jsonl'
+
+
+def default_address() -> Address:
+    """Get the service address: a Unix socket, or localhost TCP on Windows"""
+    if sys.platform == 'win32':
+        return ('127.0.0.1', 47813)
+    return str(JOBFINDER_DIR / 'ingest.sock')
+
+
+def _load_authkey(create: bool = False) -> Optional[bytes]:
+    """Read the shared secret clients use to authenticate to the service
+
+    Args:
+        create: Generate and store a new key (the service does this)
+
+    Returns:
+        Key bytes, or None if no service has created one yet
+    """
+    if create:
+        JOBFINDER_DIR.mkdir(parents=True, exist_ok=True)
+        key = os.urandom(32)
+        fd = os.open(AUTHKEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(key)
+        return key
+
+    try:
+        return AUTHKEY_FILE.read_bytes()
+    except OSError:
+        return None
+
+
+def _listening(address: Address) -> bool:
+    """Check whether anything accepts connections on an address
+
+    Only connects, without the authentication handshake, so it cannot
+    block on a peer that never answers.
+    """
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(address)
+        except OSError:
+            return False
+    return True
+
+
+class IngestionService:
+    """Local writer process that commits submitted job batches in groups"""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        address: Optional[Address] = None,
+        max_group: int = 5000,
+        group_wait: float = 0.05,
+        rejects_file: Optional[str] = None,
+        **db_options
+    ):
+        """Initialize IngestionService
+
+        Args:
+            db_path: Path to SQLite database file
+            address: Socket path or (host, port), default_address() if None
+            max_group: Maximum jobs committed in one transaction
+            group_wait: Seconds to wait for more batches before committing
+            rejects_file: JSONL file jobs that cannot be saved are appended
+                to, REJECTS_FILE if None
+            **db_options: Extra JobDatabase arguments (timeout, compact)
+        """
+        self.db = JobDatabase(db_path, **db_options)
+        self.address = address or default_address()
+        self.max_group = max_group
+        self.group_wait = group_wait
+        self.rejects_file = Path(rejects_file) if rejects_file else REJECTS_FILE
+        self.jobs_written = 0
+        self.jobs_rejected = 0
+
+        self._batches: 'queue.Queue[Optional[List[Dict]]]' = queue.Queue()
+        self._listener: Optional[Listener] = None
+        self._authkey: Optional[bytes] = None
+        self._stopped = threading.Event()
+        # Accepted client connections and the threads reading them
+        self._clients: Dict[threading.Thread, Connection] = {}
+        self._clients_lock = threading.Lock()
+
+    def serve_forever(self) -> None:
+        """Accept client connections and write until stop() is called
+
+        Raises:
+            RuntimeError: If another service is already listening on the
+                address
+        """
+        if _listening(self.address):
+            self.db.close()
+            raise RuntimeError(f"An ingestion service is already running on {self.address}")
+
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            # Left behind by a service that did not shut down cleanly
+            os.unlink(self.address)
+
+        self._authkey = _load_authkey(create=True)
+        self._listener = Listener(self.address, authkey=self._authkey)
+        writer = threading.Thread(target=self._write_loop, name='ingest-writer')
+        writer.start()
+
+        print(f"Ingestion service writing to {self.db.db_path}")
+        print(f"Listening on {self.address}")
+
+        try:
+            while not self._stopped.is_set():
+                try:
+                    conn = self._listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    if self._stopped.is_set():
+                        break
+                    continue
+
+                with self._clients_lock:
+                    if self._stopped.is_set():
+                        conn.close()
+                        break
+
+                    receiver = threading.Thread(
+                        target=self._receive,
+                        args=(conn,),
+                        name='ingest-client',
+                        daemon=True
+                    )
+                    self._clients[receiver] = conn
+                    receiver.start()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+            writer.join()
+            self.db.close()
+
+    def stop(self) -> None:
+        """Stop accepting connections and flush queued batches
+
+        Connected clients are disconnected, so their next submit() saves
+        synchronously. Every batch received before that is still written.
+        """
+        with self._clients_lock:
+            if self._stopped.is_set():
+                return
+            self._stopped.set()
+            clients = dict(self._clients)
+
+        # Wake each receiver blocked in recv(); it queues what it has read
+        # and exits on the resulting EOF
+        for conn in clients.values():
+            _shutdown(conn, self.address)
+        for receiver in clients:
+            receiver.join()
+
+        self._batches.put(None)
+
+        if self._listener is not None:
+            # Wake the accept() call blocked in serve_forever. A bare connect
+            # fails its handshake there; waiting for the handshake would hang
+            # if accept() was already busy with another client
+            _listening(self.address)
+
+            self._listener.close()
+            if isinstance(self.address, str) and os.path.exists(self.address):
+                os.unlink(self.address)
+
+    def _receive(self, conn: Connection) -> None:
+        """Queue every batch a client sends until it disconnects
+
+        Runs until the client disconnects or stop() shuts the connection
+        down; nothing received is dropped, as the writer only exits once
+        every receiver has finished.
+        """
+        try:
+            with conn:
+                while True:
+                    try:
+                        message = conn.recv()
+                    except (EOFError, OSError):
+                        return
+
+                    if isinstance(message, tuple) and message[0] == 'save_jobs':
+                        self._batches.put(message[1])
+        finally:
+            with self._clients_lock:
+                self._clients.pop(threading.current_thread(), None)
+
+    def _write_loop(self) -> None:
+        """Writer thread: commit queued batches in grouped transactions"""
+        while True:
+            batch = self._batches.get()
+            if batch is None:
+                return
+
+            group = [batch]
+            size = len(batch)
+            stop = False
+
+            while size < self.max_group:
+                try:
+                    batch = self._batches.get(timeout=self.group_wait)
+                except queue.Empty:
+                    break
+
+                if batch is None:
+                    stop = True
+                    break
+                group.append(batch)
+                size += len(batch)
+
+            self._commit_group(group)
+
+            if stop:
+                return
+
+    def _commit_group(self, group: List[List[Dict]]) -> None:
+        """Save a group of batches in one transaction
+
+        If the group fails, each batch is retried on its own, and each job
+        of a failing batch on its own, so one bad job only costs itself.
+        Jobs that still fail are recorded as rejects.
+
+        Args:
+            group: Job batches as submitted
+        """
+        if self._save([job for batch in group for job in batch]):
+            return
+
+        for batch in group:
+            if len(group) > 1 and self._save(batch):
+                continue
+
+            for job in batch:
+                try:
+                    self.db.save_jobs([job])
+                    self.jobs_written += 1
+                except Exception as e:
+                    self._reject(job, e)
+
+    def _save(self, jobs: List[Dict]) -> bool:
+        """Save jobs in one transaction, False if it failed"""
+        try:
+            self.db.save_jobs(jobs)
+        except Exception:
+            return False
+        self.jobs_written += len(jobs)
+        return True
+
+    def _reject(self, job: Dict, error: Exception) -> None:
+        """Append a job that could not be saved to the rejects file"""
+        self.jobs_rejected += 1
+        record = {'rejected_at': datetime.now().isoformat(), 'error': str(error), 'job': job}
+
+        try:
+            self.rejects_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.rejects_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, default=str) + '\n')
+        except OSError as e:
+            print(f"Ingestion error, could not record rejected job: {e}")
+            return
+
+        print(f"Ingestion error, job rejected ({error}); saved to {self.rejects_file}")
+
+
+def _shutdown(conn: Connection, address: Address) -> None:
+    """Shut a client connection down so a blocked recv() sees EOF"""
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    try:
+        sock = socket.fromfd(conn.fileno(), family, socket.SOCK_STREAM)
+    except OSError:
+        return
+
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    finally:
+        sock.close()
+
+
+class IngestionClient:
+    """Submits jobs to the ingestion service, or saves them directly"""
+
+    def __init__(
+        self,
+        db: Optional[JobDatabase] = None,
+        address: Optional[Address] = None
+    ):
+        """Initialize IngestionClient
+
+        Args:
+            db: Database used when the service is not running; opened on
+                demand at the default path if None
+            address: Service address, default_address() if None
+        """
+        self.address = address or default_address()
+        self._db = db
+        self._conn: Optional[Connection] = None
+
+    def submit(self, jobs: Iterable[Dict]) -> bool:
+        """Hand jobs to the service without waiting for them to be written
+
+        Args:
+            jobs: Job data dictionaries
+
+        Returns:
+            True if queued with the service, False if saved synchronously
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return True
+
+        for _ in range(2):
+            conn = self._connect()
+            if conn is None:
+                break
+
+            try:
+                conn.send(('save_jobs', jobs))
+                return True
+            except (OSError, EOFError):
+                # Service restarted since we connected; retry once
+                self._disconnect()
+
+        if self._db is None:
+            self._db = JobDatabase()
+        self._db.save_jobs(jobs)
+        return False
+
+    def close(self) -> None:
+        """Close the connection to the service"""
+        self._disconnect()
+
+    def _connect(self) -> Optional[Connection]:
+        """Connect to the service, None if it is not running"""
+        if self._conn is not None:
+            return self._conn
+
+        if isinstance(self.address, str) and not os.path.exists(self.address):
+            return None
+
+        authkey = _load_authkey()
+        if authkey is None:
+            return None
+
+        try:
+            self._conn = Client(self.address, authkey=authkey)
+        except (OSError, EOFError, AuthenticationError):
+            return None
+
+        return self._conn
+
+    def _disconnect(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+            self._conn = None
+
+
+def main() -> None:
+    """Command-line entry point"""
+    service = IngestionService(sys.argv[1] if len(sys.argv) > 1 else None, compact=True)
+    try:
+        service.serve_forever()
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,21 +2,249 @@
 Job Database - Stores and manages discovered jobs
 """
 
+import base64
+import hashlib
 import json
+import re
 import sqlite3
-from typing import Dict, List, Optional
+import threading
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime, timedelta
+
+from .codec import compress_json, decompress_json
+from .migrations import (
+    FTS_COLUMNS,
+    SCHEMA_VERSION,
+    STATS_DIMENSIONS,
+    get_schema_version,
+    rebuild_job_stats,
+    run_migrations
+)
+
+# Connection tuning applied to every pooled connection. WAL lets readers
+# (views/exports) run alongside the discovery writer; NORMAL sync is safe
+# under WAL and avoids an fsync per commit.
+CONNECTION_PRAGMAS = (
+    ('journal_mode', 'WAL'),
+    ('synchronous', 'NORMAL'),
+    ('cache_size', -20000),         # ~20MB page cache
+    ('mmap_size', 268435456),       # 256MB memory-mapped I/O
+    ('temp_store', 'MEMORY'),
+)
+
+# Comparison operators accepted in JSON column filters
+JSON_FILTER_OPERATORS = ('=', '!=', '>', '>=', '<', '<=')
+
+# Affinities allowed for JSON generated columns ('' keeps JSON's own types)
+JSON_COLUMN_TYPES = ('', 'TEXT', 'REAL', 'INTEGER', 'NUMERIC')
+
+# Stores a description body the first time its normalized hash is seen
+SAVE_DESCRIPTION_SQL = '''
+    INSERT INTO descriptions (hash, body) VALUES (:description_hash, :description)
+    ON CONFLICT(hash) DO NOTHING
+'''
+
+# Upsert that leaves lifecycle fields (status, applied_at, discovered_at)
+# alone and skips the write entirely when the content hash is unchanged.
+# description is only kept inline when it differs from the shared body.
+SAVE_JOB_SQL = '''
+    INSERT INTO jobs (
+        id, platform, title, company, location, description,
+        requirements, salary_min, salary_max, work_type, url,
+        posted_date, match_score, status, data, discovered_at,
+        content_hash, last_seen_at, description_hash
+    ) VALUES (
+        :id, :platform, :title, :company, :location,
+        CASE
+            WHEN (SELECT body FROM descriptions WHERE hash = :description_hash) = :description
+            THEN NULL
+            ELSE :description
+        END,
+        :requirements, :salary_min, :salary_max, :work_type, :url,
+        :posted_date, :match_score, :status, :data, :seen_at,
+        :content_hash, :seen_at, :description_hash
+    )
+    ON CONFLICT(id) DO UPDATE SET
+        platform = excluded.platform,
+        title = excluded.title,
+        company = excluded.company,
+        location = excluded.location,
+        description = excluded.description,
+        requirements = excluded.requirements,
+        salary_min = excluded.salary_min,
+        salary_max = excluded.salary_max,
+        work_type = excluded.work_type,
+        url = excluded.url,
+        posted_date = excluded.posted_date,
+        match_score = excluded.match_score,
+        data = excluded.data,
+        content_hash = excluded.content_hash,
+        last_seen_at = excluded.last_seen_at,
+        description_hash = excluded.description_hash
+    WHERE jobs.content_hash IS NOT excluded.content_hash
+'''
+
+# Unchanged rediscoveries only refresh last_seen_at, at most once per day,
+# so repeat runs within a day write nothing
+TOUCH_JOB_SQL = '''
+    UPDATE jobs SET last_seen_at = :seen_at
+    WHERE id = :id
+      AND content_hash = :content_hash
+      AND substr(last_seen_at, 1, 10) < substr(:seen_at, 1, 10)
+'''
+
+# Compressed raw_data of compact rows, rewritten only when the job changed
+SAVE_RAW_SQL = '''
+    INSERT INTO job_raw (job_id, content_hash, data)
+    VALUES (:id, :content_hash, :raw)
+    ON CONFLICT(job_id) DO UPDATE SET
+        content_hash = excluded.content_hash,
+        data = excluded.data
+    WHERE job_raw.content_hash IS NOT excluded.content_hash
+'''
+
+# Typed columns a compact row reads back instead of storing twice
+JOB_COLUMNS = (
+    'id', 'platform', 'title', 'company', 'location', 'description',
+    'requirements', 'salary_min', 'salary_max', 'work_type', 'url',
+    'posted_date'
+)
+INTEGER_JOB_COLUMNS = ('salary_min', 'salary_max')
+
+# Description text, inline or from the shared descriptions body
+DESCRIPTION_SQL = (
+    'IFNULL(jobs.description, '
+    '(SELECT body FROM descriptions WHERE hash = jobs.description_hash))'
+)
+
+# SQL for reading a jobs column where it is not simply jobs.<name>
+COLUMN_SQL = {'description': DESCRIPTION_SQL}
+
+# Selected by every reader that returns job dicts; see _row_to_job
+JOB_SELECT = 'jobs.data, ' + ', '.join(
+    COLUMN_SQL.get(name, f'jobs.{name}') for name in JOB_COLUMNS
+)
+JOB_SELECT_WIDTH = 1 + len(JOB_COLUMNS)
+
+# Keys recording which fields a compact row keeps outside its data JSON
+COMPACT_COLUMNS_KEY = '__columns__'
+COMPACT_RAW_KEY = '__raw__'
+
+
+def description_hash(text: str) -> str:
+    """Hash a description by its normalized text
+
+    Case, Unicode compatibility forms and whitespace are normalized, so a
+    description reposted with different spacing or capitalization gets
+    the same hash.
+
+    Args:
+        text: Description text
+
+    Returns:
+        Hex digest identifying the text
+    """
+    normalized = ' '.join(unicodedata.normalize('NFKC', text).casefold().split())
+    return hashlib.sha1(normalized.encode()).hexdigest()
+
+
+class JobCache:
+    """Thread-safe bounded LRU cache of parsed jobs keyed by job ID"""
+
+    def __init__(self, capacity: int):
+        """Initialize JobCache
+
+        Args:
+            capacity: Maximum number of jobs kept; 0 disables caching
+        """
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Look up a job, counting the hit or miss
+
+        Returns:
+            A shallow copy of the cached job, or None on a miss
+        """
+        with self._lock:
+            job = self._entries.get(job_id)
+            if job is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(job_id)
+            self.hits += 1
+            return dict(job)
+
+    def put(self, job_id: str, job: Dict) -> None:
+        """Cache a job, evicting the least recently used one if full"""
+        if self.capacity <= 0:
+            return
+
+        with self._lock:
+            self._entries[job_id] = dict(job)
+            self._entries.move_to_end(job_id)
+
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, job_ids: Iterable[str]) -> None:
+        """Drop cached entries for the given job IDs"""
+        with self._lock:
+            for job_id in job_ids:
+                self._entries.pop(job_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Get cache counters for sizing
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, size and capacity
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'capacity': self.capacity
+            }
 
 
 class JobDatabase:
     """SQLite-based job storage and retrieval"""
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        timeout: float = 30.0,
+        cache_size: int = 0,
+        json_columns: Optional[Dict[str, str]] = None,
+        compact: bool = False
+    ):
         """Initialize JobDatabase
 
         Args:
             db_path: Path to SQLite database file
+            timeout: Seconds to wait on a locked database before failing
+            cache_size: Jobs kept in the get_job/get_jobs LRU cache (0 = off)
+            json_columns: Indexed generated columns to declare, as name to
+                JSON path (e.g. {'analysis_score': '$.analysis.match_score'})
+            compact: Write jobs in the compact format: fields held in typed
+                columns are not repeated in the data JSON, and raw_data is
+                compressed into the job_raw table (see compact_jobs)
         """
         if db_path is None:
             db_path = Path.home() / '.jobfinder' / 'jobs.db'
@@ -25,106 +253,585 @@ class JobDatabase:
 
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self.db_path = db_path
+        self.archive_path = db_path.with_name(f'{db_path.stem}_archive{db_path.suffix}')
+        self.timeout = timeout
+        self.compact = compact
+
+        # One persistent connection per thread, tracked so close() can
+        # release all of them
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        self.cache = JobCache(cache_size)
+
         self._init_database()
 
+        for name, json_path in (json_columns or {}).items():
+            if self.json_columns.get(name, {}).get('json_path') != json_path:
+                self.add_json_column(name, json_path)
+
+    def __enter__(self) -> 'JobDatabase':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use
+
+        Returns:
+            Persistent SQLite connection for the current thread
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+
+        new_file = not self.db_path.exists() or self.db_path.stat().st_size == 0
+
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False
+        )
+        if new_file:
+            # Lets archival hand freed pages back to the OS with
+            # incremental_vacuum instead of a full VACUUM. Only possible
+            # before switching to WAL writes the header; on an existing
+            # file the pragma would wait for the write lock.
+            conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+        for pragma, value in CONNECTION_PRAGMAS:
+            conn.execute(f'PRAGMA {pragma}={value}')
+
+        self._local.conn = conn
+        with self._connections_lock:
+            self._connections.append(conn)
+
+        return conn
+
+    @contextmanager
+    def _transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Run a block in a single transaction on the thread's connection
+
+        Commits on success and rolls back if the block raises. Nested
+        calls join the outermost transaction, so several writes can be
+        grouped into one commit.
+
+        Args:
+            immediate: Take the write lock up front (BEGIN IMMEDIATE), needed
+                when the block reads before it writes, e.g. migrations
+        """
+        conn = self._connect()
+        depth = getattr(self._local, 'depth', 0)
+
+        if depth:
+            self._local.depth = depth + 1
+            try:
+                yield conn
+            finally:
+                self._local.depth = depth
+            return
+
+        self._local.depth = 1
+        self._local.invalidated = []
+        try:
+            with conn:
+                if immediate:
+                    conn.execute('BEGIN IMMEDIATE')
+                yield conn
+        finally:
+            self._local.depth = 0
+            # Readers may have re-cached the old rows before the commit
+            self.cache.invalidate(self._local.invalidated)
+            self._local.invalidated = []
+
+    def _invalidate(self, job_ids: List[str]) -> None:
+        """Drop cached jobs now and, inside a transaction, again after it ends
+
+        Until the outermost transaction commits, other connections still
+        read the old rows and could cache them again.
+        """
+        self.cache.invalidate(job_ids)
+        if getattr(self._local, 'depth', 0):
+            self._local.invalidated.extend(job_ids)
+
+    def close(self) -> None:
+        """Close every pooled connection opened by this instance"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass
+
+        self._local = threading.local()
+
     def _init_database(self) -> None:
-        """Initialize database schema"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS jobs (
-                    id TEXT PRIMARY KEY,
-                    platform TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    company TEXT NOT NULL,
-                    location TEXT,
-                    description TEXT,
-                    requirements TEXT,
-                    salary_min INTEGER,
-                    salary_max INTEGER,
-                    work_type TEXT,
-                    url TEXT,
-                    posted_date TEXT,
-                    match_score REAL,
-                    status TEXT DEFAULT 'new',
-                    data TEXT,
-                    discovered_at TEXT NOT NULL,
-                    applied_at TEXT
-                )
-            ''')
+        """Bring the schema up to date
 
-            conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_match_score
-                ON jobs(match_score DESC)
-            ''')
+        Already-current databases only pay for one user_version read.
+        """
+        conn = self._connect()
 
-            conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_status
-                ON jobs(status)
+        if get_schema_version(conn) < SCHEMA_VERSION:
+            run_migrations(lambda: self._transaction(immediate=True))
+
+        self.fts_enabled = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'"
+        ).fetchone() is not None
+
+        self.json_columns = {
+            name: {'json_path': json_path, 'sql_type': sql_type}
+            for name, json_path, sql_type in conn.execute(
+                'SELECT name, json_path, sql_type FROM json_columns'
+            )
+        }
+
+    def add_json_column(self, name: str, json_path: str, sql_type: str = '') -> None:
+        """Declare an indexed virtual generated column over the data JSON
+
+        The column is computed with json_extract(data, json_path) and
+        indexed, so search_jobs filters on it run in SQLite instead of in
+        Python after json.loads. Compact rows drop typed-column fields and
+        raw_data from data, so paths should point at other fields.
+
+        Args:
+            name: Column name (lowercase letters, digits and underscores)
+            json_path: JSON path into the job payload, e.g. '$.budget'
+            sql_type: Optional affinity (TEXT, REAL, INTEGER, NUMERIC)
+
+        Raises:
+            ValueError: If the name, path or type is not acceptable
+        """
+        sql_type = sql_type.upper()
+        if not re.fullmatch(r'[a-z_][a-z0-9_]*', name):
+            raise ValueError(f"Invalid column name: {name!r}")
+        if not json_path.startswith('$') or "'" in json_path:
+            raise ValueError(f"Invalid JSON path: {json_path!r}")
+        if sql_type not in JSON_COLUMN_TYPES:
+            raise ValueError(f"Invalid column type: {sql_type!r}")
+
+        with self._transaction(immediate=True) as conn:
+            existing = {row[1] for row in conn.execute('PRAGMA table_xinfo(jobs)')}
+            if name in existing and name not in self.json_columns:
+                raise ValueError(f"Column already exists: {name}")
+
+            if name in self.json_columns:
+                self._drop_json_column(conn, name)
+
+            conn.execute(f'''
+                ALTER TABLE jobs ADD COLUMN {name} {sql_type}
+                GENERATED ALWAYS AS (json_extract(data, '{json_path}')) VIRTUAL
             ''')
+            conn.execute(f'CREATE INDEX idx_json_{name} ON jobs({name})')
+            conn.execute(
+                'INSERT INTO json_columns (name, json_path, sql_type) VALUES (?, ?, ?)',
+                (name, json_path, sql_type)
+            )
+
+        self.json_columns[name] = {'json_path': json_path, 'sql_type': sql_type}
+
+    def drop_json_column(self, name: str) -> bool:
+        """Remove a declared JSON generated column and its index
+
+        Args:
+            name: Column name
+
+        Returns:
+            True if dropped, False if no such JSON column was declared
+        """
+        if name not in self.json_columns:
+            return False
+
+        with self._transaction(immediate=True) as conn:
+            self._drop_json_column(conn, name)
+
+        del self.json_columns[name]
+        return True
+
+    def _drop_json_column(self, conn: sqlite3.Connection, name: str) -> None:
+        """Drop a JSON column's index, column and registry row"""
+        conn.execute(f'DROP INDEX IF EXISTS idx_json_{name}')
+        conn.execute(f'ALTER TABLE jobs DROP COLUMN {name}')
+        conn.execute('DELETE FROM json_columns WHERE name = ?', (name,))
 
-            conn.commit()
+    def rebuild_stats(self) -> Dict:
+        """Recompute job_stats from the jobs table to repair any drift
+
+        Returns:
+            Fresh application statistics
+        """
+        with self._transaction() as conn:
+            rebuild_job_stats(conn)
+
+        return self.get_application_stats()
 
     def save_job(self, job: Dict) -> str:
         """Save or update a job listing
 
+        Rediscovering an existing job keeps its status, applied_at and
+        discovered_at; an unchanged job is not rewritten at all.
+
         Args:
             job: Job data dictionary
 
         Returns:
             Job ID
         """
-        job_id = job.get('id', self._generate_job_id(job))
+        return self.save_jobs([job])[0]
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT OR REPLACE INTO jobs (
-                    id, platform, title, company, location, description,
-                    requirements, salary_min, salary_max, work_type, url,
-                    posted_date, match_score, status, data, discovered_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job_id,
-                job.get('platform'),
-                job.get('title'),
-                job.get('company'),
-                job.get('location'),
-                job.get('description'),
-                job.get('requirements'),
-                job.get('salary_min'),
-                job.get('salary_max'),
-                job.get('work_type'),
-                job.get('url'),
-                job.get('posted_date'),
-                job.get('match_score', 0.0),
-                job.get('status', 'new'),
-                json.dumps(job),
-                datetime.now().isoformat()
-            ))
-            conn.commit()
-
-        return job_id
-
-    def get_job(self, job_id: str) -> Optional[Dict]:
+    def save_jobs(self, jobs: Iterable[Dict], chunk_size: int = 500) -> List[str]:
+        """Save or update many job listings in a single transaction
+
+        Args:
+            jobs: Iterable of job data dictionaries
+            chunk_size: Number of rows handed to each executemany call
+
+        Returns:
+            Job IDs in input order
+        """
+        job_ids = []
+        seen_at = datetime.now().isoformat()
+
+        with self._transaction() as conn:
+            chunk = []
+            for job in jobs:
+                row = self._job_row(job, seen_at)
+                job_ids.append(row['id'])
+                chunk.append(row)
+
+                if len(chunk) >= chunk_size:
+                    self._write_chunk(conn, chunk)
+                    chunk = []
+
+            if chunk:
+                self._write_chunk(conn, chunk)
+
+        self._invalidate(job_ids)
+
+        return job_ids
+
+    def _write_chunk(self, conn: sqlite3.Connection, rows: List[Dict]) -> None:
+        """Upsert a chunk of job rows
+
+        Args:
+            conn: Connection inside the save transaction
+            rows: Rows built by _job_row
+        """
+        described = [row for row in rows if row['description_hash'] is not None]
+        if described:
+            conn.executemany(SAVE_DESCRIPTION_SQL, described)
+
+        conn.executemany(SAVE_JOB_SQL, rows)
+        conn.executemany(TOUCH_JOB_SQL, rows)
+
+        raw_rows = [row for row in rows if row['raw'] is not None]
+        if raw_rows:
+            conn.executemany(SAVE_RAW_SQL, raw_rows)
+
+    def _job_row(self, job: Dict, seen_at: str) -> Dict:
+        """Build the jobs table row for a job
+
+        Args:
+            job: Job data dictionary
+            seen_at: Timestamp of this sighting
+
+        Returns:
+            Named parameters for SAVE_JOB_SQL
+        """
+        data = json.dumps(job, sort_keys=True)
+        job_id = job.get('id') or self._generate_job_id(job)
+        content_hash = hashlib.sha1(data.encode()).hexdigest()
+
+        description = job.get('description')
+        has_description = isinstance(description, str) and description.strip()
+
+        raw = None
+        if self.compact:
+            data, raw = self._compact_data(job, job_id)
+
+        return {
+            'id': job_id,
+            'platform': job.get('platform'),
+            'title': job.get('title'),
+            'company': job.get('company'),
+            'location': job.get('location'),
+            'description': job.get('description'),
+            'requirements': job.get('requirements'),
+            'salary_min': job.get('salary_min'),
+            'salary_max': job.get('salary_max'),
+            'work_type': job.get('work_type'),
+            'url': job.get('url'),
+            'posted_date': job.get('posted_date'),
+            'match_score': job.get('match_score') or 0.0,
+            'status': job.get('status', 'new'),
+            'data': data,
+            'content_hash': content_hash,
+            'description_hash': description_hash(description) if has_description else None,
+            'raw': raw,
+            'seen_at': seen_at
+        }
+
+    @staticmethod
+    def _compact_data(job: Dict, job_id: str) -> Tuple[str, Optional[bytes]]:
+        """Split a job into its compact data JSON and compressed raw_data
+
+        A field is left out of the JSON only when its typed column gives
+        back exactly the same value, so _row_to_job rebuilds an equal dict.
+
+        Args:
+            job: Job data dictionary
+            job_id: ID the row is stored under
+
+        Returns:
+            Tuple of (data JSON, compressed raw_data or None)
+        """
+        leftover = dict(job)
+        columns = []
+
+        for name in JOB_COLUMNS:
+            if name not in leftover:
+                continue
+
+            value = leftover[name]
+            if name == 'id':
+                backed = value == job_id
+            elif value is None:
+                backed = True
+            elif name in INTEGER_JOB_COLUMNS:
+                backed = type(value) is int
+            else:
+                backed = isinstance(value, str)
+
+            if backed:
+                del leftover[name]
+                columns.append(name)
+
+        raw = None
+        if 'raw_data' in leftover:
+            raw = compress_json(leftover.pop('raw_data'))
+            leftover[COMPACT_RAW_KEY] = True
+
+        leftover[COMPACT_COLUMNS_KEY] = columns
+
+        return json.dumps(leftover, sort_keys=True), raw
+
+    def compact_jobs(self, batch_size: int = 500) -> int:
+        """Rewrite rows saved in the full format into the compact format
+
+        Also moves descriptions saved before the description store into
+        it. Converts in short batches so other writers are not blocked,
+        then returns freed pages to the OS when auto_vacuum is incremental.
+
+        Args:
+            batch_size: Rows examined per transaction
+
+        Returns:
+            Number of rows converted
+        """
+        converted = 0
+        last_rowid = 0
+        description_index = 3 + 1 + JOB_COLUMNS.index('description')
+
+        while True:
+            with self._transaction(immediate=True) as conn:
+                rows = conn.execute(f'''
+                    SELECT jobs.rowid, jobs.content_hash, jobs.description_hash, {JOB_SELECT}
+                    FROM jobs
+                    WHERE jobs.rowid > ?
+                    ORDER BY jobs.rowid
+                    LIMIT ?
+                ''', (last_rowid, batch_size)).fetchall()
+
+                if not rows:
+                    break
+                last_rowid = rows[-1][0]
+
+                updates = []
+                raw_rows = []
+                described = []
+                for row in rows:
+                    rowid, content_hash, stored_hash, data, job_id = row[:5]
+                    description = row[description_index]
+                    changed = False
+
+                    if stored_hash is None and isinstance(description, str) and description.strip():
+                        described.append({
+                            'rowid': rowid,
+                            'description': description,
+                            'description_hash': description_hash(description)
+                        })
+                        changed = True
+
+                    job = json.loads(data)
+                    if COMPACT_COLUMNS_KEY not in job:
+                        data, raw = self._compact_data(job, job_id)
+                        updates.append((data, rowid))
+                        if raw is not None:
+                            raw_rows.append({'id': job_id, 'content_hash': content_hash, 'raw': raw})
+                        changed = True
+
+                    if changed:
+                        converted += 1
+
+                conn.executemany(SAVE_DESCRIPTION_SQL, described)
+                conn.executemany('''
+                    UPDATE jobs SET
+                        description_hash = :description_hash,
+                        description = CASE
+                            WHEN (SELECT body FROM descriptions WHERE hash = :description_hash) = :description
+                            THEN NULL
+                            ELSE :description
+                        END
+                    WHERE rowid = :rowid
+                ''', described)
+                conn.executemany('UPDATE jobs SET data = ? WHERE rowid = ?', updates)
+                conn.executemany(SAVE_RAW_SQL, raw_rows)
+
+            if len(rows) < batch_size:
+                break
+
+        if converted and conn.execute('PRAGMA main.auto_vacuum').fetchone()[0] == 2:
+            conn.execute('PRAGMA main.incremental_vacuum')
+
+        return converted
+
+    def _row_to_job(self, row: Tuple) -> Tuple[Dict, bool]:
+        """Rebuild a job dict from a row selected with JOB_SELECT
+
+        Args:
+            row: data JSON followed by the JOB_COLUMNS values
+
+        Returns:
+            Tuple of (job, whether its raw_data is in job_raw)
+        """
+        job = json.loads(row[0])
+        columns = job.pop(COMPACT_COLUMNS_KEY, None)
+        if columns is None:
+            return job, False
+
+        values = dict(zip(JOB_COLUMNS, row[1:JOB_SELECT_WIDTH]))
+        for name in columns:
+            job[name] = values[name]
+
+        return job, job.pop(COMPACT_RAW_KEY, False)
+
+    def _rows_to_jobs(
+        self,
+        conn: sqlite3.Connection,
+        rows: List[Tuple],
+        load_raw: bool = False,
+        schema: str = 'main'
+    ) -> List[Dict]:
+        """Rebuild job dicts, optionally loading compact rows' raw_data
+
+        Args:
+            conn: Connection the rows were read on
+            rows: Rows selected with JOB_SELECT
+            load_raw: Fetch raw_data from job_raw for compact rows
+            schema: Database the rows came from, 'main' or 'archive'
+
+        Returns:
+            Job data dictionaries in row order
+        """
+        jobs = []
+        pending = {}
+
+        for row in rows:
+            job, has_raw = self._row_to_job(row)
+            jobs.append(job)
+            if load_raw and has_raw:
+                pending[row[1]] = job
+
+        ids = list(pending)
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            placeholders = ', '.join('?' * len(chunk))
+            for job_id, blob in conn.execute(
+                f'SELECT job_id, data FROM {schema}.job_raw WHERE job_id IN ({placeholders})',
+                chunk
+            ):
+                pending[job_id]['raw_data'] = decompress_json(blob)
+
+        return jobs
+
+    def get_job(self, job_id: str, include_archive: bool = False) -> Optional[Dict]:
         """Retrieve a job by ID
 
         Args:
             job_id: Job identifier
+            include_archive: Also look in the archive database on a miss
 
         Returns:
             Job data or None
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                'SELECT data FROM jobs WHERE id = ?',
-                (job_id,)
-            )
-            row = cursor.fetchone()
+        if self.cache.capacity:
+            job = self.cache.get(job_id)
+            if job is not None:
+                return job
+
+        conn = self._connect()
+        rows = conn.execute(
+            f'SELECT {JOB_SELECT} FROM jobs WHERE id = ?',
+            (job_id,)
+        ).fetchall()
+
+        if rows:
+            job = self._rows_to_jobs(conn, rows, load_raw=True)[0]
+            self.cache.put(job_id, job)
+            return job
 
-            if row:
-                return json.loads(row[0])
+        if include_archive and self._attach_archive(conn):
+            rows = conn.execute(
+                f'SELECT {JOB_SELECT} FROM archive.jobs AS jobs WHERE id = ?',
+                (job_id,)
+            ).fetchall()
+            if rows:
+                return self._rows_to_jobs(conn, rows, load_raw=True, schema='archive')[0]
 
         return None
 
+    def get_jobs(self, job_ids: Iterable[str], chunk_size: int = 500) -> Tuple[List[Dict], List[str]]:
+        """Retrieve many jobs with one IN query per chunk of IDs
+
+        Args:
+            job_ids: Job identifiers
+            chunk_size: IDs per query, kept under SQLite's parameter limit
+
+        Returns:
+            Tuple of (jobs in input order, IDs that were not found)
+        """
+        job_ids = list(job_ids)
+        unique_ids = list(dict.fromkeys(job_ids))
+        found = {}
+
+        if self.cache.capacity:
+            for job_id in unique_ids:
+                job = self.cache.get(job_id)
+                if job is not None:
+                    found[job_id] = job
+
+        to_fetch = [job_id for job_id in unique_ids if job_id not in found]
+
+        conn = self._connect()
+        for i in range(0, len(to_fetch), chunk_size):
+            chunk = to_fetch[i:i + chunk_size]
+            placeholders = ', '.join('?' * len(chunk))
+            rows = conn.execute(
+                f'SELECT {JOB_SELECT} FROM jobs WHERE id IN ({placeholders})',
+                chunk
+            ).fetchall()
+            for row, job in zip(rows, self._rows_to_jobs(conn, rows, load_raw=True)):
+                found[row[1]] = job
+                self.cache.put(row[1], job)
+
+        jobs = [found[job_id] for job_id in job_ids if job_id in found]
+        missing = [job_id for job_id in unique_ids if job_id not in found]
+
+        return jobs, missing
+
     def get_top_matches(self, limit: int = 10, min_score: float = 0.0) -> List[Dict]:
         """Get top matching jobs
 
@@ -135,61 +842,617 @@ class JobDatabase:
         Returns:
             List of top matching jobs
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute('''
-                SELECT data FROM jobs
-                WHERE match_score >= ? AND status != 'rejected'
-                ORDER BY match_score DESC, discovered_at DESC
-                LIMIT ?
-            ''', (min_score, limit))
+        conn = self._connect()
+        rows = conn.execute(f'''
+            SELECT {JOB_SELECT} FROM jobs
+            WHERE match_score >= ? AND status != 'rejected'
+            ORDER BY match_score DESC, discovered_at DESC
+            LIMIT ?
+        ''', (min_score, limit)).fetchall()
 
-            return [json.loads(row[0]) for row in cursor.fetchall()]
+        return self._rows_to_jobs(conn, rows)
 
     def search_jobs(self, filters: Dict) -> List[Dict]:
         """Search jobs with filters
 
+        Text filters (title, company, location, keywords) are answered from
+        the jobs_fts full-text index: every word must match, as a prefix,
+        in the given column (or in any indexed column for keywords).
+        Compact rows are returned without raw_data; get_job loads it.
+
         Args:
             filters: Search filters (title, company, location, etc.)
+                - keywords: Free text matched across all indexed columns
+                - rank: Order by bm25 relevance instead of match score
+                - snippet: Add a highlighted 'snippet' to each result
+                - include_archive: Also search archived jobs (LIKE scan);
+                  they follow the hot results when ranking by relevance
+                - since_seq / max_seq: Only jobs whose change_seq is after
+                  / at most this value (see changes_since)
+                - <json column>: Value, or {operator: value} dict, for a
+                  column declared with add_json_column
 
         Returns:
             List of matching jobs
         """
-        query = 'SELECT data FROM jobs WHERE 1=1'
+        select = f'{JOB_SELECT}, jobs.match_score, jobs.discovered_at'
+        fts_query = self._build_fts_query(filters) if self.fts_enabled else None
+
+        if fts_query and filters.get('snippet'):
+            select += ", snippet(jobs_fts, -1, '[', ']', '...', 16)"
+
+        query, params = self._build_filter_query(select, filters)
+
+        if fts_query and filters.get('rank'):
+            weights = ', '.join(str(weight) for _, weight in FTS_COLUMNS)
+            query += f' ORDER BY bm25(jobs_fts, {weights})'
+        else:
+            query += ' ORDER BY jobs.match_score DESC, jobs.discovered_at DESC'
+
+        if 'limit' in filters:
+            query += ' LIMIT ?'
+            params.append(filters['limit'])
+
+        conn = self._connect()
+        rows = conn.execute(query, params).fetchall()
+
+        if filters.get('include_archive') and self._attach_archive(conn):
+            archive_query, archive_params = self._build_filter_query(
+                f'{JOB_SELECT}, jobs.match_score, jobs.discovered_at',
+                filters,
+                source='archive.jobs'
+            )
+            archived = conn.execute(archive_query, archive_params).fetchall()
+
+            if fts_query and filters.get('rank'):
+                rows += archived
+            else:
+                rows = sorted(
+                    rows + archived,
+                    key=lambda row: row[JOB_SELECT_WIDTH:JOB_SELECT_WIDTH + 2],
+                    reverse=True
+                )
+
+            if 'limit' in filters:
+                rows = rows[:filters['limit']]
+
+        results = self._rows_to_jobs(conn, rows)
+
+        snippet_index = JOB_SELECT_WIDTH + 2
+        for job, row in zip(results, rows):
+            if len(row) > snippet_index:
+                job['snippet'] = row[snippet_index]
+
+        return results
+
+    def get_jobs_page(
+        self,
+        filters: Optional[Dict] = None,
+        page_size: int = 500,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """Get one page of jobs using keyset pagination
+
+        Pages are ordered by (match_score, discovered_at, id) descending and
+        resume from the last row of the previous page, so each page costs
+        the same no matter how deep into the table it is.
+
+        Args:
+            filters: Search filters (see search_jobs; rank/limit are ignored)
+            page_size: Maximum number of jobs in the page
+            cursor: Token returned with the previous page, None for the first
+
+        Returns:
+            Tuple of (jobs, next cursor), next cursor is None on the last page
+        """
+        rows, next_cursor = self._fetch_page(JOB_SELECT, filters, page_size, cursor)
+        return self._rows_to_jobs(self._connect(), rows), next_cursor
+
+    def iter_jobs(
+        self,
+        filters: Optional[Dict] = None,
+        page_size: int = 500,
+        cursor: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """Stream jobs page by page with flat memory use
+
+        Args:
+            filters: Search filters (see search_jobs; rank/limit are ignored)
+            page_size: Number of rows fetched per query
+            cursor: Optional token from get_jobs_page to resume from
+
+        Yields:
+            Job data dictionaries in match score order
+        """
+        while True:
+            jobs, cursor = self.get_jobs_page(filters, page_size, cursor)
+            yield from jobs
+
+            if cursor is None:
+                return
+
+    def iter_row_batches(
+        self,
+        columns: List[str],
+        filters: Optional[Dict] = None,
+        batch_size: int = 5000
+    ) -> Iterator[List[Tuple]]:
+        """Stream raw column values in keyset-paginated batches
+
+        Reads typed columns directly instead of parsing the JSON payload,
+        for bulk exports and analysis.
+
+        Args:
+            columns: jobs table column names to select
+            filters: Search filters (see search_jobs; rank/limit are ignored)
+            batch_size: Rows per batch
+
+        Yields:
+            Lists of row tuples in match score order
+        """
+        known = {row[1] for row in self._connect().execute('PRAGMA table_xinfo(jobs)')}
+        unknown = [column for column in columns if column not in known]
+        if unknown:
+            raise ValueError(f"Unknown job columns: {', '.join(unknown)}")
+
+        select = ', '.join(COLUMN_SQL.get(column, f'jobs.{column}') for column in columns)
+        cursor = None
+
+        while True:
+            rows, cursor = self._fetch_page(select, filters, batch_size, cursor)
+            if rows:
+                yield rows
+
+            if cursor is None:
+                return
+
+    def _fetch_page(
+        self,
+        select: str,
+        filters: Optional[Dict],
+        page_size: int,
+        cursor: Optional[str]
+    ) -> Tuple[List[Tuple], Optional[str]]:
+        """Fetch one keyset page of selected columns
+
+        Args:
+            select: Column list to select (qualified with jobs.)
+            filters: Search filters
+            page_size: Maximum number of rows
+            cursor: Token from the previous page, None for the first
+
+        Returns:
+            Tuple of (rows, next cursor), next cursor is None on the last page
+        """
+        query, params = self._build_filter_query(
+            f'{select}, jobs.match_score, jobs.discovered_at, jobs.id',
+            filters or {}
+        )
+
+        if cursor:
+            query += ' AND (jobs.match_score, jobs.discovered_at, jobs.id) < (?, ?, ?)'
+            params.extend(self._decode_cursor(cursor))
+
+        query += (
+            ' ORDER BY jobs.match_score DESC, jobs.discovered_at DESC, jobs.id DESC'
+            ' LIMIT ?'
+        )
+        params.append(page_size)
+
+        rows = self._connect().execute(query, params).fetchall()
+
+        next_cursor = None
+        if len(rows) == page_size:
+            next_cursor = self._encode_cursor(rows[-1][-3:])
+
+        return [row[:-3] for row in rows], next_cursor
+
+    def changes_since(self, cursor: int = 0, limit: int = 500) -> Tuple[List[Dict], int]:
+        """Get jobs inserted or changed after a change cursor
+
+        Every insert, content change and status change gives the row a new,
+        strictly increasing change_seq, so consumers sync in time
+        proportional to what changed instead of rescanning the table.
+        Unchanged rediscoveries and archival are not reported.
+
+        Args:
+            cursor: Cursor returned by the previous call, 0 to start over
+            limit: Maximum number of changes returned
+
+        Returns:
+            Tuple of (changes, next cursor). Each change has seq, id,
+            status, applied_at, discovered_at and the job dict; the cursor
+            is unchanged when there is nothing new.
+        """
+        conn = self._connect()
+        rows = conn.execute(f'''
+            SELECT jobs.change_seq, jobs.status, jobs.applied_at, jobs.discovered_at,
+                   {JOB_SELECT}
+            FROM jobs
+            WHERE jobs.change_seq > ?
+            ORDER BY jobs.change_seq
+            LIMIT ?
+        ''', (cursor, limit)).fetchall()
+
+        jobs = self._rows_to_jobs(conn, [row[4:] for row in rows])
+
+        changes = [
+            {
+                'seq': row[0],
+                'id': row[5],
+                'status': row[1],
+                'applied_at': row[2],
+                'discovered_at': row[3],
+                'job': job
+            }
+            for row, job in zip(rows, jobs)
+        ]
+
+        return changes, rows[-1][0] if rows else cursor
+
+    @staticmethod
+    def _encode_cursor(key: Tuple) -> str:
+        """Encode a (match_score, discovered_at, id) key as a cursor token"""
+        return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> List:
+        """Decode a cursor token back into its sort key
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid cursor token: {cursor!r}") from e
+
+        if not isinstance(key, list) or len(key) != 3:
+            raise ValueError(f"Invalid cursor token: {cursor!r}")
+
+        return key
+
+    def _build_filter_query(
+        self,
+        select: str,
+        filters: Dict,
+        source: str = 'jobs'
+    ) -> Tuple[str, List]:
+        """Build a SELECT over jobs with the WHERE clause for search filters
+
+        Text filters go through jobs_fts when FTS5 is available and fall
+        back to LIKE scans otherwise (always for the archive).
+
+        Args:
+            select: Column list to select (qualified with jobs./jobs_fts.)
+            filters: Search filters
+            source: Table to read, 'jobs' or 'archive.jobs'
+
+        Returns:
+            Query ending in a WHERE clause, and its parameters
+        """
         params = []
+        use_fts = self.fts_enabled and source == 'jobs'
+        fts_query = self._build_fts_query(filters) if use_fts else None
+
+        if fts_query:
+            query = (
+                f'SELECT {select} FROM jobs_fts '
+                'JOIN jobs ON jobs.rowid = jobs_fts.rowid '
+                'WHERE jobs_fts MATCH ?'
+            )
+            params.append(fts_query)
+        else:
+            query = f'SELECT {select} FROM {source} AS jobs WHERE 1=1'
 
-        if 'title' in filters:
-            query += ' AND title LIKE ?'
-            params.append(f'%{filters["title"]}%')
+        if source != 'jobs':
+            # A job rediscovered after archiving is served from the hot table
+            query += ' AND jobs.id NOT IN (SELECT id FROM main.jobs)'
 
-        if 'company' in filters:
-            query += ' AND company LIKE ?'
-            params.append(f'%{filters["company"]}%')
+        if not use_fts:
+            for column in ('title', 'company', 'location'):
+                if column in filters:
+                    query += f' AND jobs.{column} LIKE ?'
+                    params.append(f'%{filters[column]}%')
 
-        if 'location' in filters:
-            query += ' AND location LIKE ?'
-            params.append(f'%{filters["location"]}%')
+            for word in re.findall(r'\w+', str(filters.get('keywords') or '')):
+                query += ' AND (' + ' OR '.join(
+                    COLUMN_SQL.get(name, f'jobs.{name}') + ' LIKE ?' for name, _ in FTS_COLUMNS
+                ) + ')'
+                params.extend([f'%{word}%'] * len(FTS_COLUMNS))
 
         if 'min_score' in filters:
-            query += ' AND match_score >= ?'
+            query += ' AND jobs.match_score >= ?'
             params.append(filters['min_score'])
 
         if 'status' in filters:
-            query += ' AND status = ?'
+            query += ' AND jobs.status = ?'
             params.append(filters['status'])
 
-        query += ' ORDER BY match_score DESC, discovered_at DESC'
+        if 'platform' in filters:
+            query += ' AND jobs.platform = ?'
+            params.append(filters['platform'])
 
-        if 'limit' in filters:
-            query += ' LIMIT ?'
-            params.append(filters['limit'])
+        # Change window, for incremental exports
+        if 'since_seq' in filters:
+            query += ' AND jobs.change_seq > ?'
+            params.append(filters['since_seq'])
+
+        if 'max_seq' in filters:
+            query += ' AND jobs.change_seq <= ?'
+            params.append(filters['max_seq'])
+
+        for name, spec in self.json_columns.items():
+            if name not in filters:
+                continue
+
+            # The archive has no generated columns; extract on the fly there
+            if source == 'jobs':
+                column = f'jobs.{name}'
+            else:
+                column = f"json_extract(jobs.data, '{spec['json_path']}')"
+
+            conditions = filters[name]
+            if not isinstance(conditions, dict):
+                conditions = {'=': conditions}
+
+            for operator, value in conditions.items():
+                if operator not in JSON_FILTER_OPERATORS:
+                    raise ValueError(f"Unsupported operator for {name}: {operator!r}")
+                query += f' AND {column} {operator} ?'
+                params.append(value)
+
+        return query, params
+
+    def _build_fts_query(self, filters: Dict) -> Optional[str]:
+        """Translate text filters into an FTS5 MATCH expression
+
+        Args:
+            filters: Search filters
+
+        Returns:
+            MATCH expression, or None if no text filters were given
+        """
+        clauses = []
+
+        for column in ('title', 'company', 'location'):
+            terms = self._fts_terms(filters.get(column))
+            if terms:
+                clauses.append(f'{column} : {terms}')
+
+        terms = self._fts_terms(filters.get('keywords'))
+        if terms:
+            clauses.append(terms)
+
+        return ' AND '.join(clauses) or None
+
+    @staticmethod
+    def _fts_terms(text: Optional[str]) -> Optional[str]:
+        """Quote each word of user text as an FTS5 prefix term
+
+        Args:
+            text: Raw search text
+
+        Returns:
+            Parenthesized AND of prefix terms, or None if text has no words
+        """
+        words = re.findall(r'\w+', str(text)) if text else []
+        if not words:
+            return None
+
+        return '(' + ' AND '.join(f'"{word}"*' for word in words) + ')'
+
+    def archive_stale_jobs(self, max_age_days: int = 90, batch_size: int = 500) -> int:
+        """Move stale, never-applied jobs into the archive database
+
+        Jobs not seen for max_age_days that were never applied to are
+        copied to the attached archive and deleted from the hot table in
+        short batches, so indexes and match-score scans only cover live
+        postings. Freed pages are returned with an incremental vacuum when
+        the database uses auto_vacuum=INCREMENTAL (new databases do; convert
+        older ones once with enable_incremental_vacuum). Archive copies of
+        jobs that were rediscovered since are dropped.
+
+        Args:
+            max_age_days: Age in days (by last sighting) before archiving
+            batch_size: Jobs moved per transaction
+
+        Returns:
+            Number of jobs archived
+        """
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        conn = self._connect()
+        self._attach_archive(conn, create=True)
+
+        columns = self._sync_archive_columns(conn)
+        column_list = ', '.join(columns)
+
+        with self._transaction(immediate=True) as conn:
+            conn.execute('DELETE FROM archive.jobs WHERE id IN (SELECT id FROM main.jobs)')
+            conn.execute('DELETE FROM archive.job_raw WHERE job_id IN (SELECT id FROM main.jobs)')
+
+        # Archived rows keep their description inline, independent of the
+        # hot database's description store
+        select_list = ', '.join(
+            f'{DESCRIPTION_SQL} AS description' if name == 'description' else f'jobs.{name}'
+            for name in columns
+        )
+        archived = 0
+
+        while True:
+            with self._transaction(immediate=True) as conn:
+                job_ids = [row[0] for row in conn.execute('''
+                    SELECT id FROM jobs
+                    WHERE last_seen_at < ?
+                      AND applied_at IS NULL
+                      AND IFNULL(status, '') NOT IN ('applied', 'interview')
+                    LIMIT ?
+                ''', (cutoff, batch_size))]
+
+                if not job_ids:
+                    break
+
+                placeholders = ', '.join('?' * len(job_ids))
+                conn.execute(f'''
+                    INSERT OR REPLACE INTO archive.jobs ({column_list}, archived_at)
+                    SELECT {select_list}, ? FROM main.jobs AS jobs
+                    WHERE jobs.id IN ({placeholders})
+                ''', [datetime.now().isoformat()] + job_ids)
+                conn.execute(f'''
+                    INSERT OR REPLACE INTO archive.job_raw (job_id, content_hash, data)
+                    SELECT job_id, content_hash, data FROM main.job_raw
+                    WHERE job_id IN ({placeholders})
+                ''', job_ids)
+                conn.execute(
+                    f'DELETE FROM main.jobs WHERE id IN ({placeholders})',
+                    job_ids
+                )
+
+            self._invalidate(job_ids)
+            archived += len(job_ids)
+
+            if len(job_ids) < batch_size:
+                break
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(query, params)
-            return [json.loads(row[0]) for row in cursor.fetchall()]
+        if archived:
+            self.prune_descriptions()
+
+            if conn.execute('PRAGMA main.auto_vacuum').fetchone()[0] == 2:
+                conn.execute('PRAGMA main.incremental_vacuum')
+
+        return archived
+
+    def enable_incremental_vacuum(self) -> bool:
+        """Switch a database created before incremental auto-vacuum to it
+
+        New databases start with auto_vacuum=INCREMENTAL, but the mode of an
+        existing file only changes with a full VACUUM, which rewrites the
+        whole database and blocks writers while it runs. Run it once, e.g.
+        before the first archive_stale_jobs on an old database.
+
+        Returns:
+            True if the database was converted, False if it already was
+
+        Raises:
+            RuntimeError: If called inside a transaction
+        """
+        if getattr(self._local, 'depth', 0):
+            raise RuntimeError("enable_incremental_vacuum can't run inside a transaction")
+
+        conn = self._connect()
+        if conn.execute('PRAGMA main.auto_vacuum').fetchone()[0] == 2:
+            return False
+
+        conn.execute('PRAGMA main.auto_vacuum=INCREMENTAL')
+        conn.execute('VACUUM main')
+
+        # VACUUM may renumber rowids, which the FTS index refers to
+        if self.fts_enabled:
+            with self._transaction(immediate=True) as conn:
+                conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+
+        return True
+
+    def _attach_archive(self, conn: sqlite3.Connection, create: bool = False) -> bool:
+        """Attach the archive database to a connection if it exists
+
+        Args:
+            conn: Pooled connection
+            create: Create the archive database if it does not exist yet
+
+        Returns:
+            True if the archive is attached
+        """
+        attached = any(
+            row[1] == 'archive' for row in conn.execute('PRAGMA database_list')
+        )
+        if attached:
+            return True
+
+        if not create and not self.archive_path.exists():
+            return False
+
+        conn.execute('ATTACH DATABASE ? AS archive', (str(self.archive_path),))
+        conn.execute('PRAGMA archive.journal_mode=WAL')
+        return True
+
+    def _sync_archive_columns(self, conn: sqlite3.Connection) -> List[str]:
+        """Create the archive tables or add columns the hot table has gained
+
+        Args:
+            conn: Connection with the archive attached
+
+        Returns:
+            Column names shared by the hot and archive tables
+        """
+        columns = [
+            (row[1], row[2]) for row in conn.execute('PRAGMA main.table_info(jobs)')
+        ]
+
+        with self._transaction(immediate=True) as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS archive.jobs (
+                    id TEXT PRIMARY KEY,
+                    archived_at TEXT
+                )
+            ''')
+
+            existing = {
+                row[1] for row in conn.execute('PRAGMA archive.table_info(jobs)')
+            }
+            for name, sql_type in columns:
+                if name not in existing:
+                    conn.execute(f'ALTER TABLE archive.jobs ADD COLUMN {name} {sql_type}')
+
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS archive.idx_archive_match_score
+                ON jobs(match_score DESC)
+            ''')
+
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS archive.job_raw (
+                    job_id TEXT PRIMARY KEY,
+                    content_hash TEXT,
+                    data BLOB NOT NULL
+                )
+            ''')
+
+        return [name for name, _ in columns]
+
+    def description_refs(self, description: str) -> int:
+        """Count jobs whose description matches this text once normalized
+
+        Lets detail fetches and analysis skip text they have already seen
+        without reading any job rows.
+
+        Args:
+            description: Description text
+
+        Returns:
+            Number of stored jobs with the same description, 0 if unseen
+        """
+        row = self._connect().execute(
+            'SELECT refs FROM descriptions WHERE hash = ?',
+            (description_hash(description),)
+        ).fetchone()
+
+        return max(row[0], 0) if row else 0
+
+    def prune_descriptions(self) -> int:
+        """Delete stored descriptions no job points at any more
+
+        Returns:
+            Number of descriptions deleted
+        """
+        with self._transaction(immediate=True) as conn:
+            return conn.execute('DELETE FROM descriptions WHERE refs <= 0').rowcount
 
     def update_status(self, job_id: str, status: str) -> bool:
         """Update job application status
 
+        The change is appended to job_events in the same transaction, and
+        the first move to 'applied' stamps applied_at.
+
         Args:
             job_id: Job identifier
             status: New status (new/saved/applied/rejected/interview)
@@ -197,45 +1460,185 @@ class JobDatabase:
         Returns:
             True if updated, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                'UPDATE jobs SET status = ? WHERE id = ?',
-                (status, job_id)
-            )
-            conn.commit()
-            return cursor.rowcount > 0
+        now = datetime.now().isoformat()
+
+        with self._transaction(immediate=True) as conn:
+            row = conn.execute(
+                'SELECT status FROM jobs WHERE id = ?',
+                (job_id,)
+            ).fetchone()
+
+            if row is None:
+                return False
+
+            if row[0] == status:
+                return True
+
+            conn.execute('''
+                UPDATE jobs SET
+                    status = ?,
+                    applied_at = CASE
+                        WHEN ? = 'applied' THEN IFNULL(applied_at, ?)
+                        ELSE applied_at
+                    END
+                WHERE id = ?
+            ''', (status, status, now, job_id))
+
+            conn.execute('''
+                INSERT INTO job_events (job_id, from_status, to_status, ts)
+                VALUES (?, ?, ?, ?)
+            ''', (job_id, row[0], status, now))
+
+        self._invalidate([job_id])
+
+        return True
+
+    def get_events(
+        self,
+        start: str,
+        end: Optional[str] = None,
+        to_status: Optional[str] = None
+    ) -> List[Dict]:
+        """Get status changes in a time range
+
+        Args:
+            start: Inclusive ISO timestamp (or date) lower bound
+            end: Exclusive ISO timestamp upper bound, open-ended if None
+            to_status: Only changes into this status
+
+        Returns:
+            Events ordered by time
+        """
+        query = 'SELECT job_id, from_status, to_status, ts FROM job_events WHERE ts >= ?'
+        params = [start]
+
+        if end is not None:
+            query += ' AND ts < ?'
+            params.append(end)
+
+        if to_status is not None:
+            query += ' AND to_status = ?'
+            params.append(to_status)
+
+        query += ' ORDER BY ts'
+
+        return [
+            {'job_id': row[0], 'from_status': row[1], 'to_status': row[2], 'ts': row[3]}
+            for row in self._connect().execute(query, params)
+        ]
+
+    def get_job_timeline(self, job_id: str) -> Dict:
+        """Get a job's discovery, application and status history
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Dictionary with discovered_at, applied_at, days_to_apply and
+            events, or an empty dict if the job is not found
+        """
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT discovered_at, applied_at FROM jobs WHERE id = ?',
+            (job_id,)
+        ).fetchone()
+
+        if row is None:
+            return {}
+
+        discovered_at, applied_at = row
+        days_to_apply = None
+        if discovered_at and applied_at:
+            delta = datetime.fromisoformat(applied_at) - datetime.fromisoformat(discovered_at)
+            days_to_apply = delta.total_seconds() / 86400
+
+        events = [
+            {'from_status': event[0], 'to_status': event[1], 'ts': event[2]}
+            for event in conn.execute('''
+                SELECT from_status, to_status, ts FROM job_events
+                WHERE job_id = ?
+                ORDER BY ts
+            ''', (job_id,))
+        ]
+
+        return {
+            'job_id': job_id,
+            'discovered_at': discovered_at,
+            'applied_at': applied_at,
+            'days_to_apply': days_to_apply,
+            'events': events
+        }
+
+    def get_daily_digest(self, day: Optional[date] = None) -> Dict:
+        """Summarize one day's status changes, reading only that day's events
+
+        Args:
+            day: Day to summarize, today if None
+
+        Returns:
+            Dictionary with date, per-status transition counts and events
+        """
+        day = day or date.today()
+        events = self.get_events(
+            day.isoformat(),
+            (day + timedelta(days=1)).isoformat()
+        )
+
+        transitions = {}
+        for event in events:
+            transitions[event['to_status']] = transitions.get(event['to_status'], 0) + 1
+
+        return {
+            'date': day.isoformat(),
+            'transitions': transitions,
+            'events': events
+        }
+
+    def get_cache_stats(self) -> Dict:
+        """Get job cache hit/miss counters
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, size and capacity
+        """
+        return self.cache.stats()
 
     def get_application_stats(self) -> Dict:
         """Get application statistics
 
+        Reads the trigger-maintained job_stats table, so the cost does not
+        grow with the number of jobs.
+
         Returns:
             Dictionary with statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute('''
-                SELECT
-                    status,
-                    COUNT(*) as count
-                FROM jobs
-                GROUP BY status
-            ''')
+        breakdown = {dimension: {} for dimension in STATS_DIMENSIONS}
+        total = 0
+        scored_count = 0
+        scored_sum = 0.0
 
-            stats = {row[0]: row[1] for row in cursor.fetchall()}
+        cursor = self._connect().execute(
+            'SELECT dimension, value, count, score_sum FROM job_stats WHERE count > 0'
+        )
 
-            cursor = conn.execute('SELECT COUNT(*) FROM jobs')
-            total = cursor.fetchone()[0]
+        for dimension, value, count, score_sum in cursor:
+            if dimension == 'total':
+                total = count
+                continue
 
-            cursor = conn.execute('''
-                SELECT AVG(match_score) FROM jobs
-                WHERE status != 'rejected'
-            ''')
-            avg_score = cursor.fetchone()[0] or 0.0
+            breakdown[dimension][value or None] = count
 
-            return {
-                'total': total,
-                'by_status': stats,
-                'average_match_score': avg_score
-            }
+            # Average excludes rejected jobs
+            if dimension == 'status' and value and value != 'rejected':
+                scored_count += count
+                scored_sum += score_sum
+
+        return {
+            'total': total,
+            'by_status': breakdown['status'],
+            'by_platform': breakdown['platform'],
+            'by_work_type': breakdown['work_type'],
+            'average_match_score': scored_sum / scored_count if scored_count else 0.0
+        }
 
     def _generate_job_id(self, job: Dict) -> str:
         """Generate a unique job ID
@@ -246,6 +1649,5 @@ class JobDatabase:
         Returns:
             Unique identifier
         """
-        import hashlib
         content = f"{job.get('platform')}:{job.get('company')}:{job.get('title')}:{job.get('url')}"
         return hashlib.md5(content.encode()).hexdigest()
@@ -0,0 +1,654 @@
+"""
+Migrations - Versioned schema changes for the jobs database
+
+Each migration brings the database to a numbered schema version recorded
+in SQLite's user_version pragma. Migrations run in order, exactly once per
+database, and every step is written to be safe to re-run so a crash part
+way through simply resumes on the next open.
+"""
+
+import sqlite3
+import time
+from typing import Callable, ContextManager, Dict, List, NamedTuple, Optional
+
+
+# Columns covered by the jobs_fts full-text index, with their bm25 weights
+FTS_COLUMNS = (
+    ('title', 10.0),
+    ('company', 5.0),
+    ('location', 2.0),
+    ('description', 1.0),
+    ('requirements', 1.0),
+)
+
+# Columns counted in the job_stats table maintained by triggers
+STATS_DIMENSIONS = ('status', 'platform', 'work_type')
+
+
+class Migration(NamedTuple):
+    """A single schema version step
+
+    apply runs in one write transaction. backfill, if given, is an UPDATE
+    taking a :batch_size parameter that is repeated in separate short
+    transactions until it touches fewer rows than the batch size, so large
+    rewrites never hold the write lock for long.
+    """
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Connection], None]
+    backfill: Optional[str] = None
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Get the schema version recorded in the database
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        Current user_version
+    """
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def ensure_columns(conn: sqlite3.Connection, table: str, columns: Dict[str, str]) -> None:
+    """Add columns missing from a table created by an older version
+
+    Args:
+        conn: Connection inside the migration transaction
+        table: Table name
+        columns: Column name to SQL type
+    """
+    existing = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+
+    for name, sql_type in columns.items():
+        if name not in existing:
+            conn.execute(f'ALTER TABLE {table} ADD COLUMN {name} {sql_type}')
+
+
+def _create_jobs_table(conn: sqlite3.Connection) -> None:
+    """Create the jobs table and its original indexes"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            platform TEXT NOT NULL,
+            title TEXT NOT NULL,
+            company TEXT NOT NULL,
+            location TEXT,
+            description TEXT,
+            requirements TEXT,
+            salary_min INTEGER,
+            salary_max INTEGER,
+            work_type TEXT,
+            url TEXT,
+            posted_date TEXT,
+            match_score REAL,
+            status TEXT DEFAULT 'new',
+            data TEXT,
+            discovered_at TEXT NOT NULL,
+            applied_at TEXT
+        )
+    ''')
+
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_match_score
+        ON jobs(match_score DESC)
+    ''')
+
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_status
+        ON jobs(status)
+    ''')
+
+
+def _add_upsert_columns(conn: sqlite3.Connection) -> None:
+    """Add the content hash and last sighting columns used by upserts"""
+    ensure_columns(conn, 'jobs', {
+        'content_hash': 'TEXT',
+        'last_seen_at': 'TEXT'
+    })
+
+
+def _add_keyset_index(conn: sqlite3.Connection) -> None:
+    """Index the (match_score, discovered_at, id) pagination sort key"""
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_score_discovered_id
+        ON jobs(match_score DESC, discovered_at DESC, id DESC)
+    ''')
+
+
+def _create_fts(conn: sqlite3.Connection) -> None:
+    """Create the jobs_fts full-text index table
+
+    Skipped when SQLite is built without FTS5; search then falls back to
+    LIKE scans. Only the table is created here, to record that FTS5 is
+    available: migration 10 always follows in the same run and recreates
+    it over jobs_text with its triggers, indexing existing rows once.
+    """
+    columns = ', '.join(name for name, _ in FTS_COLUMNS)
+
+    try:
+        conn.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                {columns},
+                content='jobs',
+                content_rowid='rowid'
+            )
+        ''')
+    except sqlite3.OperationalError:
+        pass  # No FTS5 in this SQLite build
+
+
+def _create_job_stats(conn: sqlite3.Connection) -> None:
+    """Create the job_stats table and the triggers that maintain it
+
+    job_stats holds a row count and match score sum per status, platform
+    and work_type value (plus an overall 'total' row), so application
+    stats never scan the jobs table.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS job_stats (
+            dimension TEXT NOT NULL,
+            value TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            score_sum REAL NOT NULL DEFAULT 0.0,
+            PRIMARY KEY (dimension, value)
+        ) WITHOUT ROWID
+    ''')
+
+    def bump(row: str, sign: str) -> str:
+        keys = [("'total'", "''")] + [
+            (f"'{dimension}'", f"IFNULL({row}.{dimension}, '')")
+            for dimension in STATS_DIMENSIONS
+        ]
+        return '\n'.join(
+            f'''
+            INSERT INTO job_stats (dimension, value, count, score_sum)
+            VALUES ({dimension}, {value}, {sign}1, {sign}IFNULL({row}.match_score, 0.0))
+            ON CONFLICT (dimension, value) DO UPDATE SET
+                count = count + excluded.count,
+                score_sum = score_sum + excluded.score_sum;
+            '''
+            for dimension, value in keys
+        )
+
+    watched = ', '.join(STATS_DIMENSIONS + ('match_score',))
+
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS job_stats_insert AFTER INSERT ON jobs
+        BEGIN {bump('new', '+')} END
+    ''')
+
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS job_stats_delete AFTER DELETE ON jobs
+        BEGIN {bump('old', '-')} END
+    ''')
+
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS job_stats_update
+        AFTER UPDATE OF {watched} ON jobs
+        BEGIN {bump('old', '-')} {bump('new', '+')} END
+    ''')
+
+    rebuild_job_stats(conn)
+
+
+def _add_last_seen_index(conn: sqlite3.Connection) -> None:
+    """Index last_seen_at for the retention scan"""
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_last_seen
+        ON jobs(last_seen_at)
+    ''')
+
+
+def _create_job_events(conn: sqlite3.Connection) -> None:
+    """Create the append-only job_events status transition log"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS job_events (
+            id INTEGER PRIMARY KEY,
+            job_id TEXT NOT NULL,
+            from_status TEXT,
+            to_status TEXT NOT NULL,
+            ts TEXT NOT NULL
+        )
+    ''')
+
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_job_events_ts
+        ON job_events(ts)
+    ''')
+
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_job_events_job
+        ON job_events(job_id, ts)
+    ''')
+
+
+def _create_json_columns_registry(conn: sqlite3.Connection) -> None:
+    """Create the registry of user-declared JSON generated columns"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS json_columns (
+            name TEXT PRIMARY KEY,
+            json_path TEXT NOT NULL,
+            sql_type TEXT NOT NULL DEFAULT ''
+        )
+    ''')
+
+
+def _create_job_raw(conn: sqlite3.Connection) -> None:
+    """Create the side table holding compressed raw platform payloads
+
+    Compact rows keep raw_data here instead of in the data column, so
+    scans and searches never page it in. Rows follow their job on delete.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS job_raw (
+            job_id TEXT PRIMARY KEY,
+            content_hash TEXT,
+            data BLOB NOT NULL
+        )
+    ''')
+
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS job_raw_delete AFTER DELETE ON jobs
+        BEGIN
+            DELETE FROM job_raw WHERE job_id = old.id;
+        END
+    ''')
+
+
+def _create_descriptions(conn: sqlite3.Connection) -> None:
+    """Create the content-addressed description store
+
+    Reposted descriptions are stored once in descriptions, keyed by the
+    hash of their normalized text, and jobs point at them through
+    description_hash. jobs.description is left NULL when the stored body
+    is the job's exact text, so the full-text index now reads through the
+    jobs_text view that resolves it. Triggers keep refs equal to the
+    number of jobs pointing at each body; unreferenced bodies are removed
+    by JobDatabase.prune_descriptions.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS descriptions (
+            hash TEXT PRIMARY KEY,
+            body TEXT NOT NULL,
+            refs INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_descriptions_unreferenced
+        ON descriptions(hash) WHERE refs <= 0
+    ''')
+
+    ensure_columns(conn, 'jobs', {'description_hash': 'TEXT'})
+
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_description_hash
+        ON jobs(description_hash)
+    ''')
+
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS descriptions_ref_insert AFTER INSERT ON jobs
+        WHEN new.description_hash IS NOT NULL
+        BEGIN
+            UPDATE descriptions SET refs = refs + 1 WHERE hash = new.description_hash;
+        END
+    ''')
+
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS descriptions_ref_delete AFTER DELETE ON jobs
+        WHEN old.description_hash IS NOT NULL
+        BEGIN
+            UPDATE descriptions SET refs = refs - 1 WHERE hash = old.description_hash;
+        END
+    ''')
+
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS descriptions_ref_update
+        AFTER UPDATE OF description_hash ON jobs
+        WHEN old.description_hash IS NOT new.description_hash
+        BEGIN
+            UPDATE descriptions SET refs = refs - 1 WHERE hash = old.description_hash;
+            UPDATE descriptions SET refs = refs + 1 WHERE hash = new.description_hash;
+        END
+    ''')
+
+    conn.execute('''
+        CREATE VIEW IF NOT EXISTS jobs_text AS
+        SELECT jobs.rowid AS job_rowid, jobs.title, jobs.company, jobs.location,
+               IFNULL(jobs.description, descriptions.body) AS description,
+               jobs.requirements
+        FROM jobs
+        LEFT JOIN descriptions ON descriptions.hash = jobs.description_hash
+    ''')
+
+    has_fts = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'"
+    ).fetchone() is not None
+    if not has_fts:
+        return
+
+    for trigger in ('jobs_fts_insert', 'jobs_fts_delete', 'jobs_fts_update'):
+        conn.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+    conn.execute('DROP TABLE jobs_fts')
+
+    columns = ', '.join(name for name, _ in FTS_COLUMNS)
+
+    def values(row: str) -> str:
+        return ', '.join(
+            f'IFNULL({row}.description, '
+            f'(SELECT body FROM descriptions WHERE hash = {row}.description_hash))'
+            if name == 'description' else f'{row}.{name}'
+            for name, _ in FTS_COLUMNS
+        )
+
+    conn.execute(f'''
+        CREATE VIRTUAL TABLE jobs_fts USING fts5(
+            {columns},
+            content='jobs_text',
+            content_rowid='job_rowid'
+        )
+    ''')
+
+    conn.execute(f'''
+        CREATE TRIGGER jobs_fts_insert AFTER INSERT ON jobs
+        BEGIN
+            INSERT INTO jobs_fts(rowid, {columns})
+            VALUES (new.rowid, {values('new')});
+        END
+    ''')
+
+    conn.execute(f'''
+        CREATE TRIGGER jobs_fts_delete AFTER DELETE ON jobs
+        BEGIN
+            INSERT INTO jobs_fts(jobs_fts, rowid, {columns})
+            VALUES ('delete', old.rowid, {values('old')});
+        END
+    ''')
+
+    conn.execute(f'''
+        CREATE TRIGGER jobs_fts_update
+        AFTER UPDATE OF {columns}, description_hash ON jobs
+        BEGIN
+            INSERT INTO jobs_fts(jobs_fts, rowid, {columns})
+            VALUES ('delete', old.rowid, {values('old')});
+            INSERT INTO jobs_fts(rowid, {columns})
+            VALUES (new.rowid, {values('new')});
+        END
+    ''')
+
+    conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+
+
+def _add_change_seq(conn: sqlite3.Connection) -> None:
+    """Stamp every insert and content or status change with a sequence number
+
+    The sequence comes from the single-row change_counter table rather
+    than MAX(change_seq), so it never goes backwards when the newest rows
+    are archived. Sightings that only move last_seen_at do not count as
+    changes.
+    """
+    ensure_columns(conn, 'jobs', {'change_seq': 'INTEGER'})
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS change_counter (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            seq INTEGER NOT NULL
+        )
+    ''')
+
+    # Existing rows are numbered by rowid in the backfill, so new changes
+    # start above the largest one
+    conn.execute('''
+        INSERT OR IGNORE INTO change_counter (id, seq)
+        SELECT 0, IFNULL(MAX(rowid), 0) FROM jobs
+    ''')
+
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_change_seq
+        ON jobs(change_seq)
+    ''')
+
+    stamp = '''
+        UPDATE change_counter SET seq = seq + 1 WHERE id = 0;
+        UPDATE jobs SET change_seq = (SELECT seq FROM change_counter WHERE id = 0)
+        WHERE rowid = new.rowid;
+    '''
+
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS jobs_change_insert AFTER INSERT ON jobs
+        BEGIN {stamp} END
+    ''')
+
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS jobs_change_update
+        AFTER UPDATE OF content_hash, status, applied_at ON jobs
+        BEGIN {stamp} END
+    ''')
+
+
+def _create_sync_peers(conn: sqlite3.Connection) -> None:
+    """Create the per-peer watermarks used by delta sync bundles"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS sync_peers (
+            peer TEXT PRIMARY KEY,
+            change_seq INTEGER NOT NULL DEFAULT 0,
+            event_id INTEGER NOT NULL DEFAULT 0,
+            exported_at TEXT
+        )
+    ''')
+
+
+def _create_queue(conn: sqlite3.Connection) -> None:
+    """Create the job queue tables that replace the JSON queue files
+
+    queue holds the items of every named queue (job_queue,
+    multi_platform_queue) with their common fields as columns and any
+    others in data. queue_urls remembers the canonical URL hash of every
+    item ever queued, across all queues, for duplicate detection, and
+    queue_imports records which legacy files have been imported.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS queue (
+            id INTEGER PRIMARY KEY,
+            queue TEXT NOT NULL,
+            platform TEXT,
+            title TEXT,
+            company TEXT,
+            location TEXT,
+            budget TEXT,
+            description TEXT,
+            url TEXT,
+            url_hash TEXT,
+            status TEXT NOT NULL DEFAULT 'queued',
+            match_score REAL,
+            added_at TEXT NOT NULL,
+            applied_at TEXT,
+            data TEXT
+        )
+    ''')
+
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_queue_status
+        ON queue(queue, status, id)
+    ''')
+
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_queue_platform
+        ON queue(queue, platform)
+    ''')
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS queue_urls (
+            url_hash TEXT PRIMARY KEY,
+            first_seen TEXT NOT NULL
+        ) WITHOUT ROWID
+    ''')
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS queue_imports (
+            path TEXT PRIMARY KEY,
+            queue TEXT NOT NULL,
+            imported INTEGER NOT NULL,
+            duplicates INTEGER NOT NULL,
+            imported_at TEXT NOT NULL
+        )
+    ''')
+
+
+def _monotonic_queue_keys(conn: sqlite3.Connection) -> None:
+    """Rebuild the queue table with AUTOINCREMENT keys
+
+    A plain INTEGER PRIMARY KEY hands the key of a deleted newest item to
+    the next one added, which would hide it from exports that resume
+    after the last exported key.
+    """
+    conn.execute('''
+        CREATE TABLE queue_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            queue TEXT NOT NULL,
+            platform TEXT,
+            title TEXT,
+            company TEXT,
+            location TEXT,
+            budget TEXT,
+            description TEXT,
+            url TEXT,
+            url_hash TEXT,
+            status TEXT NOT NULL DEFAULT 'queued',
+            match_score REAL,
+            added_at TEXT NOT NULL,
+            applied_at TEXT,
+            data TEXT
+        )
+    ''')
+    conn.execute('INSERT INTO queue_new SELECT * FROM queue')
+    conn.execute('DROP TABLE queue')
+    conn.execute('ALTER TABLE queue_new RENAME TO queue')
+
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_queue_status
+        ON queue(queue, status, id)
+    ''')
+
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_queue_platform
+        ON queue(queue, platform)
+    ''')
+
+
+def rebuild_job_stats(conn: sqlite3.Connection) -> None:
+    """Repopulate job_stats with one GROUP BY per dimension
+
+    Args:
+        conn: Connection inside a write transaction
+    """
+    conn.execute('DELETE FROM job_stats')
+    conn.execute('''
+        INSERT INTO job_stats (dimension, value, count, score_sum)
+        SELECT 'total', '', COUNT(*), IFNULL(SUM(match_score), 0.0) FROM jobs
+    ''')
+
+    for dimension in STATS_DIMENSIONS:
+        conn.execute(f'''
+            INSERT INTO job_stats (dimension, value, count, score_sum)
+            SELECT '{dimension}', IFNULL({dimension}, ''), COUNT(*),
+                   IFNULL(SUM(match_score), 0.0)
+            FROM jobs
+            GROUP BY IFNULL({dimension}, '')
+        ''')
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, 'jobs table', _create_jobs_table),
+    Migration(2, 'content hash upserts', _add_upsert_columns),
+    Migration(
+        3,
+        'keyset pagination index',
+        _add_keyset_index,
+        # Row-value comparisons never match NULL scores, so legacy rows
+        # saved without one would drop out of paginated scans
+        backfill='''
+            UPDATE jobs SET match_score = 0.0
+            WHERE rowid IN (
+                SELECT rowid FROM jobs WHERE match_score IS NULL LIMIT :batch_size
+            )
+        '''
+    ),
+    Migration(4, 'full-text search index', _create_fts),
+    Migration(5, 'materialized job stats', _create_job_stats),
+    Migration(
+        6,
+        'retention index',
+        _add_last_seen_index,
+        # Rows saved before upserts have no last sighting; use discovery
+        backfill='''
+            UPDATE jobs SET last_seen_at = discovered_at
+            WHERE rowid IN (
+                SELECT rowid FROM jobs WHERE last_seen_at IS NULL LIMIT :batch_size
+            )
+        '''
+    ),
+    Migration(7, 'status event log', _create_job_events),
+    Migration(8, 'JSON generated column registry', _create_json_columns_registry),
+    Migration(9, 'compact raw payload table', _create_job_raw),
+    Migration(10, 'content-addressed descriptions', _create_descriptions),
+    Migration(
+        11,
+        'change sequence',
+        _add_change_seq,
+        backfill='''
+            UPDATE jobs SET change_seq = rowid
+            WHERE rowid IN (
+                SELECT rowid FROM jobs WHERE change_seq IS NULL LIMIT :batch_size
+            )
+        '''
+    ),
+    Migration(12, 'sync peer watermarks', _create_sync_peers),
+    Migration(13, 'job queue tables', _create_queue),
+    Migration(14, 'monotonic queue keys', _monotonic_queue_keys),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def run_migrations(
+    transaction: Callable[[], ContextManager[sqlite3.Connection]],
+    batch_size: int = 5000,
+    pause: float = 0.05
+) -> int:
+    """Apply every migration newer than the database's schema version
+
+    Args:
+        transaction: Factory for an immediate write transaction
+        batch_size: Rows updated per backfill transaction
+        pause: Seconds to sleep between backfill batches so other writers
+            can get the lock
+
+    Returns:
+        Schema version after migrating
+    """
+    for migration in MIGRATIONS:
+        with transaction() as conn:
+            if get_schema_version(conn) >= migration.version:
+                continue
+            migration.apply(conn)
+
+        if migration.backfill:
+            while True:
+                with transaction() as conn:
+                    changed = conn.execute(
+                        migration.backfill,
+                        {'batch_size': batch_size}
+                    ).rowcount
+
+                if changed < batch_size:
+                    break
+                time.sleep(pause)
+
+        with transaction() as conn:
+            if get_schema_version(conn) < migration.version:
+                conn.execute(f'PRAGMA user_version = {migration.version}')
+
+    return SCHEMA_VERSION
@@ -0,0 +1,117 @@
+"""
+Queue Log - Canonical job URLs and replay of old JSONL queue logs
+
+Queues used to be kept as append-only JSONL logs next to the legacy JSON
+files (job_queue.jsonl, multi_platform_queue.jsonl), one add, update or
+remove record per line. They now live in jobs.db (see QueueStore), and
+read_queue_log only replays such a log once, when it is imported.
+
+canonical_url and url_hash reduce job URLs to the form used to recognize
+the same posting queued twice.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+
+# Query parameters known to identify the job itself (Indeed jk/vjk,
+# LinkedIn currentJobId, Greenhouse gh_jid, ZipRecruiter jid, Glassdoor
+# jl/jobListingId); when a URL has any, every other parameter is dropped
+JOB_ID_PARAMS = (
+    'jk', 'vjk', 'id', 'jobid', 'job_id', 'currentjobid', 'gh_jid',
+    'jid', 'jl', 'joblistingid'
+)
+
+# Tracking and navigation parameters dropped from URLs without a known job
+# ID parameter; anything else is kept, as it may be what identifies the job
+TRACKING_PARAMS = (
+    'ref', 'refid', 'trk', 'trackingid', 'from', 'src', 'source', 'fbclid',
+    'gclid', 'msclkid', 'position', 'pagenum', 'vjs', 'tk', 'lvk', 'sjdu'
+)
+TRACKING_PREFIXES = ('utm_', 'mc_')
+
+
+def canonical_url(url: Optional[str]) -> Optional[str]:
+    """Reduce a job URL to the form used for duplicate detection
+
+    The host is lowercased without a www. prefix, the scheme, fragment and
+    trailing slash are dropped. Query parameters are sorted and reduced to
+    the known job ID parameters if there are any, otherwise stripped of
+    tracking parameters only, so an unfamiliar ID parameter never makes
+    distinct postings look the same.
+
+    Args:
+        url: Job URL as scraped
+
+    Returns:
+        Canonical URL, or None if there is no usable URL
+    """
+    if not url or not isinstance(url, str):
+        return None
+
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or '').lower()
+    if not host:
+        return None
+    if host.startswith('www.'):
+        host = host[4:]
+
+    params = [(key.lower(), value) for key, value in parse_qsl(parts.query)]
+    query = sorted(param for param in params if param[0] in JOB_ID_PARAMS)
+    if not query:
+        query = sorted(
+            (key, value) for key, value in params
+            if key not in TRACKING_PARAMS and not key.startswith(TRACKING_PREFIXES)
+        )
+
+    canonical = host + parts.path.rstrip('/')
+    if query:
+        canonical += '?' + urlencode(query)
+
+    return canonical
+
+
+def url_hash(url: Optional[str]) -> Optional[str]:
+    """Hash a URL's canonical form, None if it has no usable URL"""
+    canonical = canonical_url(url)
+    if canonical is None:
+        return None
+    return hashlib.sha1(canonical.encode()).hexdigest()[:16]
+
+
+def read_queue_log(log_file: Union[str, Path]) -> List[Dict]:
+    """Rebuild a queue from a JSONL queue log, without changing the file
+
+    Replay stops at the first torn or unreadable line, which can only be
+    a write cut short by a crash.
+
+    Args:
+        log_file: <queue>.jsonl log
+
+    Returns:
+        Queued jobs in the order they were added
+    """
+    jobs: 'OrderedDict[int, Dict]' = OrderedDict()
+
+    with open(log_file, 'rb') as f:
+        for raw in f:
+            if not raw.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(raw)
+                op, key = record['op'], record['key']
+            except (ValueError, KeyError, TypeError):
+                break
+
+            if op == 'add':
+                jobs[key] = dict(record['job'])
+            elif op == 'update' and key in jobs:
+                jobs[key].update(record['fields'])
+            elif op == 'remove':
+                jobs.pop(key, None)
+
+    return list(jobs.values())
@@ -0,0 +1,595 @@
+"""
+Queue Store - Job queues kept in jobs.db
+
+Replaces the job_queue.json and multi_platform_queue.json files: each is
+now a named queue in the queue table, so views and exports are indexed
+queries and duplicate URLs are caught across every queue. Legacy files
+(and the .jsonl logs older versions kept beside them) are read in once by
+import_legacy.
+
+Run the importer by hand with:
+    python -m scripts.storage.queue_store import <queue file> [queue name]
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .file_lock import file_lock
+from .job_database import JobDatabase
+from .queue_log import read_queue_log, url_hash
+
+
+# Queue item fields stored as columns; anything else goes in data
+QUEUE_COLUMNS = (
+    'platform', 'title', 'company', 'location', 'budget', 'description',
+    'url', 'status', 'match_score', 'added_at', 'applied_at'
+)
+
+QUEUE_SELECT = 'id, data, ' + ', '.join(QUEUE_COLUMNS)
+
+INSERT_ITEM_SQL = f'''
+    INSERT INTO queue (queue, url_hash, data, {', '.join(QUEUE_COLUMNS)})
+    VALUES (:queue, :url_hash, :data, {', '.join(':' + name for name in QUEUE_COLUMNS)})
+'''
+
+
+class QueueStore:
+    """A named job queue stored in the queue table of jobs.db"""
+
+    def __init__(
+        self,
+        name: str,
+        db: Optional[JobDatabase] = None,
+        legacy_file: Optional[str] = None
+    ):
+        """Initialize QueueStore
+
+        Args:
+            name: Queue name, e.g. 'job_queue' or 'multi_platform_queue'
+            db: Database holding the queue, the default jobs.db if None
+            legacy_file: JSON queue file to import on first use, if it (or
+                its .jsonl log) exists and was not imported already
+        """
+        self.name = name
+        self._owns_db = db is None
+        self.db = db or JobDatabase()
+        self._dedup_stats = {'checked': 0, 'duplicates': 0}
+
+        if legacy_file is not None:
+            self.import_legacy(legacy_file)
+
+    def __enter__(self) -> 'QueueStore':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def add(self, job: Dict) -> int:
+        """Append a job to the queue
+
+        Args:
+            job: Queue item
+
+        Returns:
+            Key identifying the job in later updates
+        """
+        return self._insert([job])[0]
+
+    def add_unique(self, job: Dict) -> Optional[int]:
+        """Append a job unless its URL was ever queued, in any queue
+
+        URLs are compared by canonical form (see queue_log.canonical_url).
+        Jobs without a usable URL are always added.
+
+        Args:
+            job: Queue item
+
+        Returns:
+            Key of the new job, or None if it was a duplicate
+        """
+        self._dedup_stats['checked'] += 1
+        keys = self._insert([job], unique=True)
+        if keys[0] is None:
+            self._dedup_stats['duplicates'] += 1
+        return keys[0]
+
+    def add_many(self, jobs: List[Dict], unique: bool = True) -> List[Optional[int]]:
+        """Append many jobs in one transaction
+
+        Args:
+            jobs: Queue items
+            unique: Skip jobs whose URL was ever queued (see add_unique)
+
+        Returns:
+            Keys in input order, None for skipped duplicates
+        """
+        keys = self._insert(jobs, unique=unique)
+        if unique:
+            self._dedup_stats['checked'] += len(keys)
+            self._dedup_stats['duplicates'] += keys.count(None)
+        return keys
+
+    def update(self, key: int, **fields) -> None:
+        """Change fields of a queued job
+
+        Args:
+            key: Job key from add() or items()
+            **fields: Fields to set, e.g. status='skipped'
+
+        Raises:
+            KeyError: If no job has this key
+        """
+        with self.db._transaction(immediate=True) as conn:
+            row = conn.execute(
+                f'SELECT {QUEUE_SELECT} FROM queue WHERE id = ? AND queue = ?',
+                (key, self.name)
+            ).fetchone()
+            if row is None:
+                raise KeyError(key)
+
+            job = self._row_to_job(row)
+            job.update(fields)
+            params = self._item_params(job)
+            params['id'] = key
+
+            conn.execute(f'''
+                UPDATE queue SET
+                    url_hash = :url_hash,
+                    data = :data,
+                    {', '.join(f'{name} = :{name}' for name in QUEUE_COLUMNS)}
+                WHERE id = :id
+            ''', params)
+
+            if params['url_hash'] is not None:
+                self._remember_urls(conn, [params['url_hash']])
+
+    def remove(self, key: int) -> None:
+        """Drop a job from the queue (its URL stays known for dedup)
+
+        Raises:
+            KeyError: If no job has this key
+        """
+        with self.db._transaction() as conn:
+            deleted = conn.execute(
+                'DELETE FROM queue WHERE id = ? AND queue = ?',
+                (key, self.name)
+            ).rowcount
+        if not deleted:
+            raise KeyError(key)
+
+    def clear(self, keep_status: str = 'queued') -> int:
+        """Remove every job whose status is not keep_status
+
+        Returns:
+            Number of jobs removed
+        """
+        with self.db._transaction() as conn:
+            return conn.execute(
+                'DELETE FROM queue WHERE queue = ? AND status IS NOT ?',
+                (self.name, keep_status)
+            ).rowcount
+
+    def get(self, key: int) -> Optional[Dict]:
+        """Get a queued job, None if there is no such key"""
+        row = self.db._connect().execute(
+            f'SELECT {QUEUE_SELECT} FROM queue WHERE id = ? AND queue = ?',
+            (key, self.name)
+        ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def has_url(self, url: Optional[str]) -> bool:
+        """Check whether this URL, in canonical form, was ever queued"""
+        key = url_hash(url)
+        if key is None:
+            return False
+        return self.db._connect().execute(
+            'SELECT 1 FROM queue_urls WHERE url_hash = ?',
+            (key,)
+        ).fetchone() is not None
+
+    def items(
+        self,
+        status: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Tuple[int, Dict]]:
+        """Get (key, job) pairs in the order jobs were added
+
+        Args:
+            status: Only jobs with this status
+            limit: Maximum number of jobs
+
+        Returns:
+            Queued jobs with their keys
+        """
+        query = f'SELECT {QUEUE_SELECT} FROM queue WHERE queue = ?'
+        params: List = [self.name]
+
+        if status is not None:
+            query += ' AND status = ?'
+            params.append(status)
+
+        query += ' ORDER BY id'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        return [
+            (row[0], self._row_to_job(row))
+            for row in self.db._connect().execute(query, params)
+        ]
+
+    def jobs(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Get queued jobs in the order they were added
+
+        Args:
+            status: Only jobs with this status
+            limit: Maximum number of jobs
+
+        Returns:
+            Queue items
+        """
+        return [job for _, job in self.items(status, limit)]
+
+    def iter_jobs(self, status: Optional[str] = None, batch_size: int = 1000) -> Iterator[Dict]:
+        """Stream queued jobs in key order with flat memory use
+
+        Args:
+            status: Only jobs with this status
+            batch_size: Rows fetched per query
+
+        Yields:
+            Queue items
+        """
+        last_key = 0
+        conn = self.db._connect()
+
+        while True:
+            query = f'SELECT {QUEUE_SELECT} FROM queue WHERE queue = ? AND id > ?'
+            params: List = [self.name, last_key]
+            if status is not None:
+                query += ' AND status = ?'
+                params.append(status)
+            query += ' ORDER BY id LIMIT ?'
+            params.append(batch_size)
+
+            rows = conn.execute(query, params).fetchall()
+            for row in rows:
+                yield self._row_to_job(row)
+
+            if len(rows) < batch_size:
+                return
+            last_key = rows[-1][0]
+
+    def iter_row_batches(
+        self,
+        columns: List[str],
+        filters: Optional[Dict] = None,
+        batch_size: int = 50000
+    ) -> Iterator[List[Tuple]]:
+        """Stream queue columns as lists of row tuples, in key order
+
+        Args:
+            columns: 'id' (the job key) or names from QUEUE_COLUMNS
+            filters: Optional filters
+                - status: Only jobs with this status
+                - platform: Only jobs from this platform
+                - min_score: Only jobs with at least this match score
+                - since_id / max_id: Only keys after / at most this value
+            batch_size: Rows per batch
+
+        Yields:
+            Lists of up to batch_size tuples, values in columns order
+
+        Raises:
+            ValueError: If a column is not a queue column
+        """
+        unknown = [name for name in columns if name != 'id' and name not in QUEUE_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown queue columns: {', '.join(unknown)}")
+
+        filters = filters or {}
+        where = ''
+        params: List = [self.name]
+        for name, condition in (
+            ('status', 'status = ?'),
+            ('platform', 'platform = ?'),
+            ('min_score', 'match_score >= ?'),
+            ('max_id', 'id <= ?'),
+        ):
+            if filters.get(name) is not None:
+                where += f' AND {condition}'
+                params.append(filters[name])
+
+        last_key = filters.get('since_id') or 0
+        select = ', '.join(['id'] + list(columns))
+        conn = self.db._connect()
+
+        while True:
+            rows = conn.execute(
+                f'SELECT {select} FROM queue WHERE queue = ?{where} AND id > ? ORDER BY id LIMIT ?',
+                params + [last_key, batch_size]
+            ).fetchall()
+            if rows:
+                yield [row[1:] for row in rows]
+
+            if len(rows) < batch_size:
+                return
+            last_key = rows[-1][0]
+
+    def last_key(self) -> int:
+        """Key of the most recently added job, 0 if there is none"""
+        return self.db._connect().execute(
+            'SELECT IFNULL(MAX(id), 0) FROM queue WHERE queue = ?',
+            (self.name,)
+        ).fetchone()[0]
+
+    def count(self, status: Optional[str] = None) -> int:
+        """Count queued jobs, optionally with one status"""
+        query = 'SELECT COUNT(*) FROM queue WHERE queue = ?'
+        params: List = [self.name]
+        if status is not None:
+            query += ' AND status = ?'
+            params.append(status)
+        return self.db._connect().execute(query, params).fetchone()[0]
+
+    def status_counts(self) -> Dict[str, int]:
+        """Count jobs per status"""
+        return self._group_counts('status')
+
+    def platform_counts(self, status: Optional[str] = None) -> Dict[str, int]:
+        """Count jobs per platform, optionally with one status"""
+        return self._group_counts('platform', status)
+
+    def dedup_stats(self) -> Dict:
+        """Get duplicate detection counters for this session
+
+        Returns:
+            Dictionary with checked, duplicates, duplicate_rate and
+            known_urls
+        """
+        checked = self._dedup_stats['checked']
+        known = self.db._connect().execute('SELECT COUNT(*) FROM queue_urls').fetchone()[0]
+        return {
+            'checked': checked,
+            'duplicates': self._dedup_stats['duplicates'],
+            'duplicate_rate': self._dedup_stats['duplicates'] / checked if checked else 0.0,
+            'known_urls': known
+        }
+
+    def import_legacy(self, queue_file: str, batch_size: int = 1000) -> Dict:
+        """Import a JSON queue file (or its .jsonl queue log) once
+
+        JSON arrays are parsed incrementally, so the file is never held in
+        memory whole. Every item is imported, since URLs are shared across
+        queues and a legacy file may hold the only copy of an item's
+        proposal or status; duplicates counts items whose URL was already
+        known. Importing a file that was already imported does nothing.
+
+        Args:
+            queue_file: job_queue.json or multi_platform_queue.json
+            batch_size: Items inserted per transaction
+
+        Returns:
+            Dictionary with imported and duplicates counts
+        """
+        queue_file = Path(queue_file).resolve()
+        if self._imported(queue_file):
+            return {'imported': 0, 'duplicates': 0}
+
+        log_file = queue_file.with_suffix('.jsonl')
+        if log_file.exists():
+            items: Iterator[Dict] = iter(read_queue_log(log_file))
+        elif queue_file.exists():
+            items = iter_json_array(queue_file)
+        else:
+            return {'imported': 0, 'duplicates': 0}
+
+        imported = 0
+        duplicates = 0
+        batch = []
+
+        # Hold the queue file lock so a concurrent first open does not
+        # import the same file again
+        with file_lock(queue_file):
+            if self._imported(queue_file):
+                return {'imported': 0, 'duplicates': 0}
+
+            for item in items:
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    duplicates += self._import_batch(batch)
+                    imported += len(batch)
+                    batch = []
+
+            if batch:
+                duplicates += self._import_batch(batch)
+                imported += len(batch)
+
+            with self.db._transaction() as conn:
+                conn.execute('''
+                    INSERT INTO queue_imports (path, queue, imported, duplicates, imported_at)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (str(queue_file), self.name, imported, duplicates, datetime.now().isoformat()))
+
+        return {'imported': imported, 'duplicates': duplicates}
+
+    def _imported(self, queue_file: Path) -> bool:
+        """Check whether a legacy file was already imported"""
+        return self.db._connect().execute(
+            'SELECT 1 FROM queue_imports WHERE path = ?',
+            (str(queue_file),)
+        ).fetchone() is not None
+
+    def close(self) -> None:
+        """Close the database if this store opened it"""
+        if self._owns_db:
+            self.db.close()
+
+    def _insert(self, jobs: List[Dict], unique: bool = False) -> List[Optional[int]]:
+        """Insert queue items in one transaction
+
+        Args:
+            jobs: Queue items
+            unique: Skip items whose URL hash is already known
+
+        Returns:
+            Keys in input order, None for skipped duplicates
+        """
+        keys: List[Optional[int]] = []
+
+        with self.db._transaction(immediate=True) as conn:
+            for job in jobs:
+                params = self._item_params(job)
+
+                if params['url_hash'] is not None:
+                    known = not self._remember_urls(conn, [params['url_hash']])
+                    if unique and known:
+                        keys.append(None)
+                        continue
+
+                keys.append(conn.execute(INSERT_ITEM_SQL, params).lastrowid)
+
+        return keys
+
+    def _import_batch(self, jobs: List[Dict]) -> int:
+        """Insert legacy items in one transaction, recording their URLs
+
+        Returns:
+            Number of items whose URL was already known
+        """
+        duplicates = 0
+
+        with self.db._transaction(immediate=True) as conn:
+            for job in jobs:
+                params = self._item_params(job)
+                if params['url_hash'] is not None and not self._remember_urls(conn, [params['url_hash']]):
+                    duplicates += 1
+                conn.execute(INSERT_ITEM_SQL, params)
+
+        return duplicates
+
+    @staticmethod
+    def _remember_urls(conn, hashes: List[str]) -> int:
+        """Record URL hashes as seen
+
+        Returns:
+            Number of hashes that were not known before
+        """
+        now = datetime.now().isoformat()
+        return conn.executemany(
+            'INSERT OR IGNORE INTO queue_urls (url_hash, first_seen) VALUES (?, ?)',
+            [(key, now) for key in hashes]
+        ).rowcount
+
+    def _item_params(self, job: Dict) -> Dict:
+        """Build queue row parameters for an item"""
+        params = {name: job.get(name) for name in QUEUE_COLUMNS}
+        params['status'] = params['status'] or 'queued'
+        params['added_at'] = params['added_at'] or datetime.now().isoformat()
+
+        for name in ('platform', 'title', 'company', 'location', 'budget',
+                     'description', 'url', 'added_at', 'applied_at'):
+            if params[name] is not None and not isinstance(params[name], str):
+                params[name] = str(params[name])
+
+        extra = {key: value for key, value in job.items() if key not in QUEUE_COLUMNS}
+        params['data'] = json.dumps(extra) if extra else None
+        params['queue'] = self.name
+        params['url_hash'] = url_hash(job.get('url'))
+        return params
+
+    @staticmethod
+    def _row_to_job(row: Tuple) -> Dict:
+        """Rebuild a queue item from a row selected with QUEUE_SELECT"""
+        job = dict(zip(QUEUE_COLUMNS, row[2:]))
+        if row[1]:
+            job.update(json.loads(row[1]))
+        return job
+
+    def _group_counts(self, column: str, status: Optional[str] = None) -> Dict[str, int]:
+        """Count jobs in this queue per value of an indexed column"""
+        query = f'SELECT {column}, COUNT(*) FROM queue WHERE queue = ?'
+        params: List = [self.name]
+        if status is not None:
+            query += ' AND status = ?'
+            params.append(status)
+        query += f' GROUP BY {column}'
+
+        return {
+            value: count for value, count in self.db._connect().execute(query, params)
+        }
+
+
+def iter_json_array(path: Path, chunk_size: int = 1 << 16) -> Iterator[Dict]:
+    """Yield the items of a top-level JSON array without loading it whole
+
+    Args:
+        path: JSON file holding an array
+        chunk_size: Characters read at a time
+
+    Yields:
+        Array items
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    started = False
+
+    with open(path, 'r', encoding='utf-8') as f:
+        eof = False
+        while True:
+            if not eof:
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+
+            buffer = buffer.lstrip()
+            if not started:
+                if not buffer:
+                    if eof:
+                        return
+                    continue
+                if buffer[0] != '[':
+                    raise ValueError(f"{path} does not hold a JSON array")
+                buffer = buffer[1:]
+                started = True
+                continue
+
+            buffer = buffer.lstrip(', \t\r\n')
+            if buffer.startswith(']'):
+                return
+
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except ValueError:
+                if eof:
+                    raise ValueError(f"{path} ends in the middle of an item")
+                continue
+
+            yield item
+            buffer = buffer[end:]
+
+
+def main() -> None:
+    """Command-line entry point"""
+    if len(sys.argv) < 3 or sys.argv[1] != 'import':
+        print("Usage: python -m scripts.storage.queue_store import <queue file> [queue name]")
+        sys.exit(1)
+
+    queue_file = Path(sys.argv[2])
+    name = sys.argv[3] if len(sys.argv) > 3 else queue_file.stem
+
+    with QueueStore(name) as store:
+        result = store.import_legacy(queue_file)
+
+    print(f"✅ Imported {result['imported']} jobs into queue '{name}'")
+    print(f"   Skipped {result['duplicates']} duplicates")
+
+
+if __name__ == '__main__':
+    main()
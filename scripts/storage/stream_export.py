@@ -0,0 +1,317 @@
+"""
+Stream Export - CSV / JSONL exports of jobs and queues
+
+Rows are read in keyset-paginated batches and written as they arrive,
+so memory stays flat whatever the size of the store. Outputs ending in
+.gz are gzip-compressed, and .zst outputs are zstd-compressed (needs
+zstandard: pip install zstandard).
+
+Incremental exports (since=True) append only what is new since the
+previous export to the same file. For jobs that means rows added or
+changed since (by change_seq), so a changed job is appended again in its
+new state. For queues it means jobs added since. The position reached is
+kept in a <output>.state file next to the export.
+
+Run it with:
+    python -m scripts.storage.stream_export jobs <output> [options]
+    python -m scripts.storage.stream_export queue <output> [options]
+
+Options:
+    --columns a,b,c   Columns to export (default: all export columns)
+    --status S        Only rows with this status
+    --platform P      Only rows from this platform
+    --min-score N     Only rows with at least this match score
+    --queue NAME      Queue to export (default: multi_platform_queue)
+    --since           Append rows new since the last export to output
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, IO, Iterable, List, Optional, Tuple
+
+from .columnar_export import JOB_EXPORT_COLUMNS, QUEUE_EXPORT_COLUMNS
+from .file_lock import atomic_write
+from .job_database import JobDatabase
+from .queue_store import QueueStore
+
+
+# Suffixes accepted for each format, before any compression suffix
+FORMAT_SUFFIXES = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+COMPRESSION_SUFFIXES = ('.gz', '.zst')
+
+
+def export_jobs(
+    db: JobDatabase,
+    output_path: str,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Dict] = None,
+    since: bool = False,
+    batch_size: int = 5000
+) -> Dict:
+    """Export the jobs table to CSV or JSONL
+
+    Args:
+        db: JobDatabase to export
+        output_path: Destination file; the format and compression follow
+            its suffixes (.csv, .jsonl, optionally .gz or .zst)
+        columns: jobs columns to export, JOB_EXPORT_COLUMNS if None
+        filters: Search filters (see JobDatabase.search_jobs)
+        since: Append jobs added or changed since the previous export
+        batch_size: Rows read per query
+
+    Returns:
+        Dictionary with rows (written this time) and appended (whether
+        the rows were added to an earlier export)
+    """
+    columns = list(columns or [name for name, _ in JOB_EXPORT_COLUMNS])
+    filters = dict(filters or {})
+
+    # Export up to the change counter as it is now; rows changing while
+    # the export runs are picked up by the next one
+    position = db._connect().execute(
+        'SELECT seq FROM change_counter WHERE id = 0'
+    ).fetchone()[0]
+
+    previous = _load_state(output_path, 'jobs', columns) if since else None
+    if previous is not None:
+        filters['since_seq'] = previous
+    filters['max_seq'] = position
+
+    batches = db.iter_row_batches(columns, filters, batch_size)
+    return _export(output_path, 'jobs', columns, batches, previous is not None, position)
+
+
+def export_queue(
+    queue: QueueStore,
+    output_path: str,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Dict] = None,
+    since: bool = False,
+    batch_size: int = 5000
+) -> Dict:
+    """Export a job queue to CSV or JSONL
+
+    Args:
+        queue: QueueStore to export
+        output_path: Destination file; the format and compression follow
+            its suffixes (.csv, .jsonl, optionally .gz or .zst)
+        columns: Queue columns to export, QUEUE_EXPORT_COLUMNS if None
+        filters: Queue filters (see QueueStore.iter_row_batches)
+        since: Append jobs queued since the previous export
+        batch_size: Rows read per query
+
+    Returns:
+        Dictionary with rows (written this time) and appended (whether
+        the rows were added to an earlier export)
+    """
+    columns = list(columns or [name for name, _ in QUEUE_EXPORT_COLUMNS])
+    filters = dict(filters or {})
+    source = f'queue:{queue.name}'
+
+    position = queue.last_key()
+
+    previous = _load_state(output_path, source, columns) if since else None
+    if previous is not None:
+        filters['since_id'] = previous
+    filters['max_id'] = position
+
+    batches = queue.iter_row_batches(columns, filters, batch_size)
+    return _export(output_path, source, columns, batches, previous is not None, position)
+
+
+def output_format(output_path: str) -> Tuple[str, Optional[str]]:
+    """Work out the format and compression of an output file
+
+    Args:
+        output_path: e.g. jobs.csv, jobs.jsonl.gz, jobs.csv.zst
+
+    Returns:
+        Tuple of (format, compression suffix or None)
+
+    Raises:
+        ValueError: If the suffix is not a supported format
+    """
+    path = Path(output_path)
+    compression = None
+    if path.suffix in COMPRESSION_SUFFIXES:
+        compression = path.suffix
+        path = path.with_suffix('')
+
+    fmt = FORMAT_SUFFIXES.get(path.suffix)
+    if fmt is None:
+        raise ValueError(
+            f"Can't tell the export format of {output_path} "
+            f"(expected .csv or .jsonl, optionally followed by .gz or .zst)"
+        )
+
+    return fmt, compression
+
+
+def _export(
+    output_path: str,
+    source: str,
+    columns: List[str],
+    batches: Iterable[List[Tuple]],
+    append: bool,
+    position: int
+) -> Dict:
+    """Write row batches to the output, then record the position reached
+
+    On failure an appended-to output is cut back to its previous size and
+    the state is left alone, so the next incremental export starts from
+    the same place.
+    """
+    fmt, compression = output_format(output_path)
+    path = Path(output_path)
+    append = append and path.exists()
+    previous_size = path.stat().st_size if append else 0
+
+    rows_written = 0
+    try:
+        with _open_output(path, compression, append) as f:
+            if fmt == 'csv':
+                writer = csv.writer(f)
+                if previous_size == 0:
+                    writer.writerow(columns)
+                for rows in batches:
+                    writer.writerows(rows)
+                    rows_written += len(rows)
+            else:
+                for rows in batches:
+                    f.writelines(
+                        json.dumps(dict(zip(columns, row)), default=str) + '\n'
+                        for row in rows
+                    )
+                    rows_written += len(rows)
+    except BaseException:
+        if append:
+            with open(path, 'r+b') as f:
+                f.truncate(previous_size)
+        elif path.exists():
+            path.unlink()
+        raise
+
+    state = {
+        'source': source,
+        'columns': columns,
+        'position': position,
+        'exported_at': datetime.now().isoformat()
+    }
+    atomic_write(_state_path(output_path), json.dumps(state, indent=2))
+
+    return {'rows': rows_written, 'appended': append}
+
+
+def _open_output(path: Path, compression: Optional[str], append: bool) -> IO[str]:
+    """Open an output file for text writing, compressed by suffix
+
+    Appending to a compressed file adds a new gzip member or zstd frame;
+    both formats read concatenated members back as one stream.
+    """
+    mode = 'ab' if append else 'wb'
+
+    if compression == '.gz':
+        return gzip.open(path, mode.replace('b', 't'), encoding='utf-8', newline='')
+
+    if compression == '.zst':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstd export requires zstandard. Install it with: pip install zstandard"
+            )
+        raw = open(path, mode)
+        stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(stream, encoding='utf-8', newline='')
+
+    return open(path, mode.replace('b', ''), encoding='utf-8', newline='')
+
+
+def _state_path(output_path: str) -> Path:
+    """Incremental export state file for an output"""
+    path = Path(output_path)
+    return path.with_name(path.name + '.state')
+
+
+def _load_state(output_path: str, source: str, columns: List[str]) -> Optional[int]:
+    """Position the previous export to this output reached
+
+    Returns:
+        The position, or None if there is no previous export to extend
+
+    Raises:
+        ValueError: If the previous export came from another source or
+            has other columns, so rows cannot be appended to it
+    """
+    state_file = _state_path(output_path)
+    if not state_file.exists() or not os.path.exists(output_path):
+        return None
+
+    with open(state_file, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+
+    if state['source'] != source or state['columns'] != columns:
+        raise ValueError(
+            f"{output_path} was exported from {state['source']} with columns "
+            f"{','.join(state['columns'])}; export to a new file instead"
+        )
+
+    return state['position']
+
+
+def main() -> None:
+    """Command-line entry point"""
+    args = sys.argv[1:]
+    if len(args) < 2 or args[0] not in ('jobs', 'queue'):
+        print(__doc__[__doc__.index('Run it with:'):].rstrip())
+        sys.exit(1)
+
+    source, output_path = args[0], args[1]
+    options = {}
+    flags = set()
+    rest = args[2:]
+    while rest:
+        arg = rest.pop(0)
+        if arg == '--since':
+            flags.add(arg)
+        elif arg in ('--columns', '--status', '--platform', '--min-score', '--queue') and rest:
+            options[arg] = rest.pop(0)
+        else:
+            print(f"❌ Unknown option: {arg}")
+            sys.exit(1)
+
+    columns = options['--columns'].split(',') if '--columns' in options else None
+    filters = {}
+    if '--status' in options:
+        filters['status'] = options['--status']
+    if '--platform' in options:
+        filters['platform'] = options['--platform']
+    if '--min-score' in options:
+        filters['min_score'] = float(options['--min-score'])
+
+    since = '--since' in flags
+
+    try:
+        if source == 'jobs':
+            with JobDatabase() as db:
+                result = export_jobs(db, output_path, columns, filters, since)
+        else:
+            with QueueStore(options.get('--queue', 'multi_platform_queue')) as queue:
+                result = export_queue(queue, output_path, columns, filters, since)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    verb = 'Appended' if result['appended'] else 'Exported'
+    print(f"✅ {verb} {result['rows']} rows to {output_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,291 @@
+"""
+Sync - Delta bundles for keeping jobs.db in step across machines
+
+Each machine exports the rows and status events that changed since it
+last exported to a given peer, as a small compressed bundle file, and the
+peer imports it. Content follows the most recent sighting; status follows
+the most recent status change (last writer wins), so a status that was
+never changed on one side gives way to the other side's. Importing the
+same bundle twice changes nothing.
+
+Name peers by hostname (the default bundle source): an import then moves
+that peer's watermark past the rows it wrote, so they are not sent
+straight back.
+
+Run it with:
+    python -m scripts.storage.sync export <peer> [bundle]
+    python -m scripts.storage.sync import <bundle>
+"""
+
+import socket
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .codec import compress_json, decompress_json
+from .job_database import JOB_SELECT, JobDatabase
+
+
+BUNDLE_FORMAT = 1
+
+# Timestamp a job's current status was set: its latest event, or NULL if
+# the status was never changed (a default status carries no timestamp)
+STATUS_TS_SQL = '(SELECT MAX(ts) FROM job_events WHERE job_events.job_id = jobs.id)'
+
+
+def export_bundle(
+    db: JobDatabase,
+    peer: str,
+    output_path: Optional[str] = None,
+    batch_size: int = 1000
+) -> Dict:
+    """Write the changes a peer has not been sent yet to a bundle file
+
+    The peer's watermark only advances once the bundle has been written.
+    Use reset_peer to resend everything.
+
+    Args:
+        db: Database to export from
+        peer: Name of the machine the bundle is for
+        output_path: Bundle file, <peer>-<timestamp>.jfsync if None
+        batch_size: Rows read per query
+
+    Returns:
+        Dictionary with path, rows and events counts
+    """
+    conn = db._connect()
+    watermark = conn.execute(
+        'SELECT change_seq, event_id FROM sync_peers WHERE peer = ?',
+        (peer,)
+    ).fetchone() or (0, 0)
+    change_seq, event_id = watermark
+
+    rows = []
+    while True:
+        batch = conn.execute(f'''
+            SELECT jobs.change_seq, jobs.status, jobs.applied_at, jobs.discovered_at,
+                   jobs.last_seen_at, {STATUS_TS_SQL}, {JOB_SELECT}
+            FROM jobs
+            WHERE jobs.change_seq > ?
+            ORDER BY jobs.change_seq
+            LIMIT ?
+        ''', (change_seq, batch_size)).fetchall()
+
+        jobs = db._rows_to_jobs(conn, [row[6:] for row in batch], load_raw=True)
+        for row, job in zip(batch, jobs):
+            rows.append({
+                'id': row[7],
+                'status': row[1],
+                'applied_at': row[2],
+                'discovered_at': row[3],
+                'last_seen_at': row[4],
+                'status_ts': row[5],
+                'job': job
+            })
+
+        if batch:
+            change_seq = batch[-1][0]
+        if len(batch) < batch_size:
+            break
+
+    events = [
+        {'id': row[0], 'job_id': row[1], 'from_status': row[2], 'to_status': row[3], 'ts': row[4]}
+        for row in conn.execute('''
+            SELECT id, job_id, from_status, to_status, ts FROM job_events
+            WHERE id > ?
+            ORDER BY id
+        ''', (event_id,))
+    ]
+    if events:
+        event_id = events[-1]['id']
+
+    now = datetime.now()
+    if output_path is None:
+        output_path = f"{peer}-{now.strftime('%Y%m%d-%H%M%S')}.jfsync"
+
+    bundle = {
+        'format': BUNDLE_FORMAT,
+        'source': socket.gethostname(),
+        'created_at': now.isoformat(),
+        'rows': rows,
+        'events': events
+    }
+    Path(output_path).write_bytes(compress_json(bundle))
+
+    with db._transaction() as conn:
+        conn.execute('''
+            INSERT INTO sync_peers (peer, change_seq, event_id, exported_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(peer) DO UPDATE SET
+                change_seq = excluded.change_seq,
+                event_id = excluded.event_id,
+                exported_at = excluded.exported_at
+        ''', (peer, change_seq, event_id, now.isoformat()))
+
+    return {'path': output_path, 'rows': len(rows), 'events': len(events)}
+
+
+def import_bundle(db: JobDatabase, bundle_path: str, chunk_size: int = 500) -> Dict:
+    """Merge a bundle exported by another machine
+
+    New jobs are added with their original discovery time and status.
+    For jobs both sides have, content is taken from whichever side saw
+    the job last, and status from whichever side changed it last.
+    Events are added to the local log unless already present.
+
+    Args:
+        db: Database to import into
+        bundle_path: File written by export_bundle
+        chunk_size: Jobs merged per query
+
+    Returns:
+        Dictionary with rows_added, rows_updated, status_updates and
+        events_added counts
+
+    Raises:
+        ValueError: If the file is not a bundle this version can read
+    """
+    bundle = decompress_json(Path(bundle_path).read_bytes())
+    if not isinstance(bundle, dict) or bundle.get('format') != BUNDLE_FORMAT:
+        raise ValueError(f"Not a sync bundle: {bundle_path}")
+
+    stats = {'rows_added': 0, 'rows_updated': 0, 'status_updates': 0, 'events_added': 0}
+    rows = bundle['rows']
+
+    with db._transaction(immediate=True) as conn:
+        before = _sync_position(conn)
+        watermark = conn.execute(
+            'SELECT change_seq, event_id FROM sync_peers WHERE peer = ?',
+            (bundle['source'],)
+        ).fetchone()
+
+        for i in range(0, len(rows), chunk_size):
+            _merge_rows(db, conn, rows[i:i + chunk_size], stats)
+
+        for event in bundle['events']:
+            added = conn.execute('''
+                INSERT INTO job_events (job_id, from_status, to_status, ts)
+                SELECT :job_id, :from_status, :to_status, :ts
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM job_events
+                    WHERE job_id = :job_id AND ts = :ts AND to_status = :to_status
+                )
+            ''', event).rowcount
+            stats['events_added'] += added
+
+        # Don't echo the imported changes back to the machine they came
+        # from, unless other changes for it were already waiting
+        if watermark is not None:
+            after = _sync_position(conn)
+            conn.execute('''
+                UPDATE sync_peers SET
+                    change_seq = CASE WHEN change_seq >= ? THEN ? ELSE change_seq END,
+                    event_id = CASE WHEN event_id >= ? THEN ? ELSE event_id END
+                WHERE peer = ?
+            ''', (before[0], after[0], before[1], after[1], bundle['source']))
+
+    db.cache.invalidate([row['id'] for row in rows])
+
+    return stats
+
+
+def _sync_position(conn: sqlite3.Connection) -> Tuple[int, int]:
+    """Current (change counter, last event id) of the local database"""
+    return conn.execute('''
+        SELECT (SELECT seq FROM change_counter WHERE id = 0),
+               (SELECT IFNULL(MAX(id), 0) FROM job_events)
+    ''').fetchone()
+
+
+def _merge_rows(
+    db: JobDatabase,
+    conn: sqlite3.Connection,
+    rows: List[Dict],
+    stats: Dict
+) -> None:
+    """Merge one chunk of bundle rows inside the import transaction"""
+    placeholders = ', '.join('?' * len(rows))
+    local = {
+        row[0]: row[1:]
+        for row in conn.execute(f'''
+            SELECT jobs.id, jobs.last_seen_at, {STATUS_TS_SQL}
+            FROM jobs WHERE jobs.id IN ({placeholders})
+        ''', [row['id'] for row in rows])
+    }
+
+    # Content: new rows, and rows the peer has seen more recently
+    incoming = [
+        row for row in rows
+        if row['id'] not in local or (row['last_seen_at'] or '') > (local[row['id']][0] or '')
+    ]
+    for row in incoming:
+        row['local_last_seen_at'] = local[row['id']][0] if row['id'] in local else None
+        job = row['job']
+        if (job.get('id') or db._generate_job_id(job)) != row['id']:
+            job = dict(job, id=row['id'])
+        row['job'] = job
+
+    db.save_jobs([row['job'] for row in incoming])
+
+    conn.executemany('''
+        UPDATE jobs SET
+            discovered_at = MIN(discovered_at, :discovered_at),
+            last_seen_at = MAX(IFNULL(:local_last_seen_at, ''), IFNULL(:last_seen_at, ''))
+        WHERE id = :id
+    ''', incoming)
+
+    # Status: last writer wins among status changes; a status that was
+    # never changed never replaces one that was
+    newer_status = [
+        row for row in rows
+        if row['id'] not in local or (
+            row['status_ts'] is not None
+            and (local[row['id']][1] is None or row['status_ts'] > local[row['id']][1])
+        )
+    ]
+    changed = conn.executemany('''
+        UPDATE jobs SET status = :status, applied_at = IFNULL(applied_at, :applied_at)
+        WHERE id = :id AND status IS NOT :status
+    ''', newer_status).rowcount
+
+    stats['rows_added'] += sum(1 for row in rows if row['id'] not in local)
+    stats['rows_updated'] += sum(1 for row in incoming if row['id'] in local)
+    stats['status_updates'] += max(changed, 0)
+
+
+def reset_peer(db: JobDatabase, peer: str) -> None:
+    """Forget what a peer was sent, so the next bundle holds everything
+
+    Args:
+        db: Database
+        peer: Peer name
+    """
+    with db._transaction() as conn:
+        conn.execute('DELETE FROM sync_peers WHERE peer = ?', (peer,))
+
+
+def main() -> None:
+    """Command-line entry point"""
+    if len(sys.argv) < 3 or sys.argv[1] not in ('export', 'import'):
+        print("Usage:")
+        print("  python -m scripts.storage.sync export <peer> [bundle]")
+        print("  python -m scripts.storage.sync import <bundle>")
+        sys.exit(1)
+
+    with JobDatabase() as db:
+        if sys.argv[1] == 'export':
+            result = export_bundle(db, sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None)
+            print(f"✅ Wrote {result['rows']} jobs and {result['events']} events to {result['path']}")
+        else:
+            stats = import_bundle(db, sys.argv[2])
+            print(f"✅ Imported {sys.argv[2]}")
+            print(f"   New jobs: {stats['rows_added']}")
+            print(f"   Updated jobs: {stats['rows_updated']}")
+            print(f"   Status changes: {stats['status_updates']}")
+            print(f"   Events: {stats['events_added']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+
+from scripts.storage.async_job_database import AsyncJobDatabase
+
+
+def _job(n):
+    return {
+        'platform': 'test',
+        'title': f'Job {n}',
+        'company': 'Acme',
+        'url': f'https://example.com/jobs/{n}',
+    }
+
+
+def test_cancelled_write_does_not_stop_writer(tmp_path):
+    async def run():
+        db = AsyncJobDatabase(str(tmp_path / 'jobs.db'))
+        try:
+            # Hold the writer inside a group so the next write is cancelled
+            # while it is still queued
+            release = threading.Event()
+            started = threading.Event()
+
+            def block():
+                started.set()
+                release.wait(5)
+
+            blocked = asyncio.ensure_future(db._write(block))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+            cancelled = asyncio.ensure_future(db.save_job(_job(1)))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            release.set()
+            await asyncio.wait_for(blocked, 5)
+
+            job_id = await asyncio.wait_for(db.save_job(_job(2)), 5)
+            assert db._writer.is_alive()
+            assert (await db.get_job(job_id))['title'] == 'Job 2'
+        finally:
+            await db.close()
+
+    asyncio.run(run())
+
+
+def test_failed_single_write_runs_once(tmp_path):
+    async def run():
+        db = AsyncJobDatabase(str(tmp_path / 'jobs.db'))
+        calls = []
+
+        def fail():
+            calls.append(1)
+            raise ValueError('bad write')
+
+        try:
+            try:
+                await db._write(fail)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError('write should have failed')
+            assert calls == [1]
+        finally:
+            await db.close()
+
+    asyncio.run(run())
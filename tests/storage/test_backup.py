@@ -0,0 +1,52 @@
+import os
+
+from scripts.storage.backup import restore, snapshot
+from scripts.storage.job_database import JobDatabase
+
+
+def _job(n):
+    return {
+        'platform': 'upwork',
+        'title': f'Python automation {n}',
+        'company': 'Acme',
+        'url': f'https://www.upwork.com/jobs/~0{n}',
+    }
+
+
+def test_restore_without_archive_empties_current_archive(tmp_path):
+    db = JobDatabase(str(tmp_path / 'jobs.db'))
+    try:
+        db.save_job(_job(1))
+        backup = snapshot(db, str(tmp_path / 'backups' / 'before.db'))
+
+        db.save_job(_job(2))
+        with db._transaction() as conn:
+            conn.execute("UPDATE jobs SET last_seen_at = '2000-01-01'")
+        assert db.archive_stale_jobs(max_age_days=30) == 2
+
+        restore(db, str(backup))
+        results = db.search_jobs({'keywords': 'automation', 'include_archive': True})
+        assert [job['title'] for job in results] == ['Python automation 1']
+    finally:
+        db.close()
+
+
+def test_prune_keeps_files_not_named_like_snapshots(tmp_path):
+    db = JobDatabase(str(tmp_path / 'jobs.db'))
+    backups = tmp_path / 'backups'
+    backups.mkdir()
+    others = ['jobs-old.db', 'jobs-20240101-000000-copy.db', 'jobs-work.db']
+    for name in others:
+        (backups / name).write_bytes(b'')
+    for n, name in enumerate(['jobs-20240101-000000.db', 'jobs-20240102-000000.db']):
+        (backups / name).write_bytes(b'')
+        os.utime(backups / name, (n, n))
+
+    try:
+        db.save_job(_job(1))
+        snapshot(db, str(backups / 'jobs-20240103-000000.db'), keep=2)
+    finally:
+        db.close()
+
+    remaining = sorted(path.name for path in backups.iterdir())
+    assert remaining == sorted(others + ['jobs-20240102-000000.db', 'jobs-20240103-000000.db'])
@@ -0,0 +1,11 @@
+from scripts.storage.columnar_export import _to_int
+
+
+def test_to_int_drops_values_outside_int64():
+    assert _to_int('inf') is None
+    assert _to_int(float('nan')) is None
+    assert _to_int(1e30) is None
+    assert _to_int(2 ** 63) is None
+    assert _to_int(2 ** 63 - 1) == 2 ** 63 - 1
+    assert _to_int('95000.5') == 95000
+    assert _to_int('negotiable') is None
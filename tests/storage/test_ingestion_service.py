@@ -0,0 +1,51 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from scripts.storage import ingestion_service
+from scripts.storage.ingestion_service import IngestionService
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='uses a Unix socket')
+def test_second_service_refuses_to_replace_a_live_one(tmp_path, monkeypatch):
+    monkeypatch.setattr(ingestion_service, 'JOBFINDER_DIR', tmp_path)
+    monkeypatch.setattr(ingestion_service, 'AUTHKEY_FILE', tmp_path / 'ingest.key')
+    address = str(tmp_path / 'ingest.sock')
+
+    first = IngestionService(str(tmp_path / 'jobs.db'), address=address)
+    server = threading.Thread(target=first.serve_forever)
+    server.start()
+    try:
+        for _ in range(100):
+            if os.path.exists(address):
+                break
+            time.sleep(0.02)
+        key = (tmp_path / 'ingest.key').read_bytes()
+
+        second = IngestionService(str(tmp_path / 'jobs.db'), address=address)
+        errors = []
+
+        def serve_second():
+            try:
+                second.serve_forever()
+            except RuntimeError as e:
+                errors.append(e)
+
+        duplicate = threading.Thread(target=serve_second)
+        duplicate.start()
+        duplicate.join(5)
+        if duplicate.is_alive():
+            second.stop()
+            duplicate.join(5)
+
+        assert len(errors) == 1
+        assert os.path.exists(address)
+        assert (tmp_path / 'ingest.key').read_bytes() == key
+    finally:
+        first.stop()
+        server.join(5)
+
+    assert not server.is_alive()
@@ -0,0 +1,51 @@
+import sqlite3
+
+from scripts.storage.job_database import JobDatabase
+
+
+def _job(n):
+    return {
+        'platform': 'upwork',
+        'title': f'Python automation {n}',
+        'company': 'Acme',
+        'url': f'https://www.upwork.com/jobs/~0{n}',
+    }
+
+
+def test_rediscovered_job_is_not_returned_twice(tmp_path):
+    db = JobDatabase(str(tmp_path / 'jobs.db'))
+    try:
+        job_id = db.save_job(_job(1))
+        with db._transaction() as conn:
+            conn.execute("UPDATE jobs SET last_seen_at = '2000-01-01' WHERE id = ?", (job_id,))
+        assert db.archive_stale_jobs(max_age_days=30) == 1
+
+        assert db.save_job(_job(1)) == job_id
+        results = db.search_jobs({'keywords': 'automation', 'include_archive': True})
+        assert len(results) == 1
+
+        # The next archival run drops the stale archive copy
+        db.archive_stale_jobs(max_age_days=30)
+        archived = db._connect().execute('SELECT COUNT(*) FROM archive.jobs').fetchone()[0]
+        assert archived == 0
+    finally:
+        db.close()
+
+
+def test_enable_incremental_vacuum_converts_existing_database(tmp_path):
+    path = tmp_path / 'jobs.db'
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE placeholder (x)')
+    conn.close()
+
+    db = JobDatabase(str(path))
+    try:
+        db.save_job(_job(1))
+        assert db._connect().execute('PRAGMA auto_vacuum').fetchone()[0] == 0
+
+        assert db.enable_incremental_vacuum() is True
+        assert db._connect().execute('PRAGMA auto_vacuum').fetchone()[0] == 2
+        assert db.enable_incremental_vacuum() is False
+        assert len(db.search_jobs({'keywords': 'automation'})) == 1
+    finally:
+        db.close()
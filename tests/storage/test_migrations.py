@@ -0,0 +1,29 @@
+import sqlite3
+
+from scripts.storage.job_database import JobDatabase
+from scripts.storage.migrations import MIGRATIONS
+
+
+def test_full_text_index_built_when_upgrading_old_database(tmp_path):
+    path = tmp_path / 'jobs.db'
+    conn = sqlite3.connect(path)
+    with conn:
+        for migration in MIGRATIONS[:3]:
+            migration.apply(conn)
+        conn.execute('PRAGMA user_version = 3')
+        conn.executemany(
+            'INSERT INTO jobs (id, platform, title, company, description, url, discovered_at, data) '
+            "VALUES (?, ?, ?, ?, ?, ?, ?, '{}')",
+            [(f'job{n}', 'upwork', f'Python scraper {n}', 'Acme', 'Build a bot',
+              f'https://example.com/{n}', '2024-01-01T00:00:00') for n in range(20)]
+        )
+    conn.close()
+
+    db = JobDatabase(str(path))
+    try:
+        if not db.fts_enabled:
+            return
+        assert len(db.search_jobs({'keywords': 'scraper'})) == 20
+        db._connect().execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('integrity-check')")
+    finally:
+        db.close()
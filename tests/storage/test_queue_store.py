@@ -0,0 +1,55 @@
+import json
+
+from scripts.storage.job_database import JobDatabase
+from scripts.storage.queue_store import QueueStore
+
+
+def test_legacy_import_keeps_items_shared_with_another_queue(tmp_path):
+    url = 'https://www.upwork.com/jobs/~01abc'
+    search_file = tmp_path / 'multi_platform_queue.json'
+    search_file.write_text(json.dumps([{'title': 'Bot', 'url': url, 'status': 'queued'}]))
+    manual_file = tmp_path / 'job_queue.json'
+    manual_file.write_text(json.dumps([{
+        'title': 'Bot',
+        'url': url,
+        'status': 'completed',
+        'proposal': 'Hi there',
+        'applied_at': '2024-05-01T10:00:00'
+    }]))
+
+    db = JobDatabase(str(tmp_path / 'jobs.db'))
+    try:
+        QueueStore('multi_platform_queue', db, legacy_file=str(search_file))
+        queue = QueueStore('job_queue', db)
+        result = queue.import_legacy(str(manual_file))
+
+        assert result == {'imported': 1, 'duplicates': 1}
+        [job] = queue.jobs()
+        assert job['status'] == 'completed'
+        assert job['proposal'] == 'Hi there'
+        assert job['applied_at'] == '2024-05-01T10:00:00'
+    finally:
+        db.close()
+
+
+def test_legacy_log_is_replayed_without_changing_it(tmp_path):
+    queue_file = tmp_path / 'job_queue.json'
+    log_file = tmp_path / 'job_queue.jsonl'
+    records = [
+        {'op': 'add', 'key': 1, 'job': {'title': 'A', 'url': 'https://example.com/a'}},
+        {'op': 'add', 'key': 2, 'job': {'title': 'B', 'url': 'https://example.com/b'}},
+        {'op': 'update', 'key': 1, 'fields': {'status': 'skipped'}},
+        {'op': 'remove', 'key': 2},
+    ]
+    content = ''.join(json.dumps(record) + '\n' for record in records) + '{"op": "add", "ke'
+    log_file.write_text(content)
+
+    db = JobDatabase(str(tmp_path / 'jobs.db'))
+    try:
+        queue = QueueStore('job_queue', db, legacy_file=str(queue_file))
+        assert [(job['title'], job['status']) for job in queue.jobs()] == [('A', 'skipped')]
+    finally:
+        db.close()
+
+    assert log_file.read_text() == content
+    assert not (tmp_path / 'job_queue.urls').exists()
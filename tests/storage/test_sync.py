@@ -0,0 +1,65 @@
+import time
+
+from scripts.storage.job_database import JobDatabase
+from scripts.storage.sync import export_bundle, import_bundle
+
+
+JOB = {
+    'platform': 'upwork',
+    'title': 'Automation developer',
+    'company': 'Acme',
+    'url': 'https://www.upwork.com/jobs/~01abc',
+}
+
+
+def _status(db, job_id):
+    return db._connect().execute('SELECT status FROM jobs WHERE id = ?', (job_id,)).fetchone()[0]
+
+
+def test_default_status_does_not_override_applied(tmp_path):
+    laptop = JobDatabase(str(tmp_path / 'laptop.db'))
+    desktop = JobDatabase(str(tmp_path / 'desktop.db'))
+    try:
+        job_id = laptop.save_job(JOB)
+        laptop.update_status(job_id, 'applied')
+
+        # The desktop finds the same job later and never touches its status
+        time.sleep(0.01)
+        assert desktop.save_job(JOB) == job_id
+
+        bundle = str(tmp_path / 'to-laptop.jfsync')
+        export_bundle(desktop, 'laptop', bundle)
+        import_bundle(laptop, bundle)
+        assert _status(laptop, job_id) == 'applied'
+
+        bundle = str(tmp_path / 'to-desktop.jfsync')
+        export_bundle(laptop, 'desktop', bundle)
+        import_bundle(desktop, bundle)
+        assert _status(desktop, job_id) == 'applied'
+    finally:
+        laptop.close()
+        desktop.close()
+
+
+def test_latest_status_change_wins(tmp_path):
+    laptop = JobDatabase(str(tmp_path / 'laptop.db'))
+    desktop = JobDatabase(str(tmp_path / 'desktop.db'))
+    try:
+        job_id = laptop.save_job(JOB)
+        desktop.save_job(JOB)
+        laptop.update_status(job_id, 'applied')
+        time.sleep(0.01)
+        desktop.update_status(job_id, 'rejected')
+
+        bundle = str(tmp_path / 'to-laptop.jfsync')
+        export_bundle(desktop, 'laptop', bundle)
+        import_bundle(laptop, bundle)
+        assert _status(laptop, job_id) == 'rejected'
+
+        bundle = str(tmp_path / 'to-desktop.jfsync')
+        export_bundle(laptop, 'desktop', bundle)
+        import_bundle(desktop, bundle)
+        assert _status(desktop, job_id) == 'rejected'
+    finally:
+        laptop.close()
+        desktop.close()